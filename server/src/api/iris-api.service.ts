@@ -1,8 +1,29 @@
 import { Injectable, Logger } from '@nestjs/common';
 import { HttpService } from '@nestjs/axios';
 import { firstValueFrom } from 'rxjs';
+import { Agent as HttpAgent } from 'http';
+import { Agent as HttpsAgent } from 'https';
 import { buildIrisHeaders } from '../config/iris.config';
 
+// Long-lived keep-alive agents so consecutive Iris calls reuse the TCP+TLS
+// connection instead of paying the handshake round-trips on every fetch
+const httpAgent = new HttpAgent({ keepAlive: true, maxSockets: 20 });
+const httpsAgent = new HttpsAgent({ keepAlive: true, maxSockets: 20 });
+
+// Compiled once; parseDateRange dispatches on string length before testing
+const YEAR_RE = /^\d{4}$/;
+const YEAR_MONTH_RE = /^\d{4}-\d{2}$/;
+const YEAR_MONTH_DAY_RE = /^\d{4}-\d{2}-\d{2}$/;
+
+const DAYS_IN_MONTH = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31];
+
+function lastDayOfMonth(year: number, month: number): number {
+    if (month === 2 && (year % 4 === 0 && (year % 100 !== 0 || year % 400 === 0))) {
+        return 29;
+    }
+    return DAYS_IN_MONTH[month - 1];
+}
+
 interface IrisApiFilters {
     startDate: string;
     endDate: string;
@@ -90,8 +111,17 @@ export class IrisApiService {
 
             this.logger.log(`Fetching metrics from Iris API for date range: ${startDate} to ${endDate}`);
 
+            // decompress lets the server send gzip'd payloads (multi-MB for a
+            // year range) and responseType pins axios to its native JSON path
+            // without content-type sniffing
             const response = await firstValueFrom(
-                this.httpService.post(this.apiUrl, payload, { headers })
+                this.httpService.post(this.apiUrl, payload, {
+                    headers,
+                    httpAgent,
+                    httpsAgent,
+                    decompress: true,
+                    responseType: 'json'
+                })
             );
 
             this.logger.log(`Successfully fetched metrics data from Iris API`);
@@ -116,15 +146,7 @@ export class IrisApiService {
  */
     private parseDateRange(dateRange?: string): { startDate: string; endDate: string } {
         if (!dateRange) {
-            // Default to current week for API calls
-            const now = new Date();
-            const startOfWeek = new Date(now);
-            startOfWeek.setDate(now.getDate() - 6); // 7 days ago
-
-            return {
-                startDate: startOfWeek.toISOString(),
-                endDate: now.toISOString()
-            };
+            return this.defaultWeekRange();
         }
 
         // Handle custom date ranges from frontend: "startISO,endISO"
@@ -146,42 +168,49 @@ export class IrisApiService {
             };
         }
 
-        // Handle single date values (YYYY-MM-DD format from frontend presets)
-        if (dateRange.match(/^\d{4}-\d{2}-\d{2}$/)) {
-            // Single day range
-            return {
-                startDate: `${dateRange}T00:00:00.000Z`,
-                endDate: `${dateRange}T23:59:59.999Z`
-            };
-        }
-
-        // Handle year format (YYYY)
-        if (dateRange.match(/^\d{4}$/)) {
-            const year = parseInt(dateRange);
-            return {
-                startDate: `${year}-01-01T00:00:00.000Z`,
-                endDate: `${year}-12-31T23:59:59.999Z`
-            };
-        }
-
-        // Handle month format (YYYY-MM)
-        if (dateRange.match(/^\d{4}-\d{2}$/)) {
-            const [year, month] = dateRange.split('-').map(n => parseInt(n));
-            const startDate = new Date(year, month - 1, 1);
-            const endDate = new Date(year, month, 0); // Last day of month
+        // Single-value formats are distinguished by length before the regex
+        // confirms them, and expanded with pure string formatting — no Date
+        // construction, and no local-timezone drift from round-tripping
+        // through toISOString
+        switch (dateRange.length) {
+            case 10: // YYYY-MM-DD from frontend presets: single day range
+                if (YEAR_MONTH_DAY_RE.test(dateRange)) {
+                    return {
+                        startDate: `${dateRange}T00:00:00.000Z`,
+                        endDate: `${dateRange}T23:59:59.999Z`
+                    };
+                }
+                break;
 
-            return {
-                startDate: startDate.toISOString().replace(/T.*/, 'T00:00:00.000Z'),
-                endDate: endDate.toISOString().replace(/T.*/, 'T23:59:59.999Z')
-            };
+            case 4: // YYYY
+                if (YEAR_RE.test(dateRange)) {
+                    return {
+                        startDate: `${dateRange}-01-01T00:00:00.000Z`,
+                        endDate: `${dateRange}-12-31T23:59:59.999Z`
+                    };
+                }
+                break;
+
+            case 7: // YYYY-MM
+                if (YEAR_MONTH_RE.test(dateRange)) {
+                    const year = parseInt(dateRange.slice(0, 4));
+                    const month = parseInt(dateRange.slice(5));
+                    return {
+                        startDate: `${dateRange}-01T00:00:00.000Z`,
+                        endDate: `${dateRange}-${String(lastDayOfMonth(year, month)).padStart(2, '0')}T23:59:59.999Z`
+                    };
+                }
+                break;
         }
 
         this.logger.warn(`Unrecognized date range format: ${dateRange}, using default week range`);
+        return this.defaultWeekRange();
+    }
 
-        // Fallback to current week
+    private defaultWeekRange(): { startDate: string; endDate: string } {
         const now = new Date();
         const startOfWeek = new Date(now);
-        startOfWeek.setDate(now.getDate() - 6);
+        startOfWeek.setDate(now.getDate() - 6); // 7 days ago
 
         return {
             startDate: startOfWeek.toISOString(),
@@ -7,6 +7,41 @@ import { AuditService } from './audit/audit.service';
 import { DashboardService } from './dashboard.service';
 import { ReasoningService } from './reasoning.service';
 import { startTrace } from './observability/langfuse';
+import { performance } from 'perf_hooks';
+
+// Building the per-request chart-data log payload (labels, samples) costs
+// allocations even when nobody reads it, so it is opt-in via env
+const DEBUG_CHART_DATA = process.env.DEBUG_CHART_DATA === '1';
+
+// One pipe instance shared by every @Body() below; ValidationPipe is
+// stateless per-call, so there is no need to construct one per route
+const validationPipe = new ValidationPipe();
+
+/**
+ * Error-classification rules for the /chat endpoint, scanned once per error
+ * instead of re-testing the message in a branch chain
+ */
+const CHAT_ERROR_RULES: Array<{ needles: string[]; message: (errorMessage: string) => string }> = [
+    {
+        needles: ['not found in dataset'],
+        message: (errorMessage) => {
+            const available = errorMessage.split('Available metrics:')[1];
+            return `I couldn't find the requested metric in the data. ${available ? 'Available metrics: ' + available : ''}`;
+        }
+    },
+    {
+        needles: ['Date range'],
+        message: () => 'Invalid date range format. Please use YYYY or YYYY-MM format (e.g., "2025" or "2025-06").'
+    },
+    {
+        needles: ['OpenAI', 'tool call'],
+        message: () => 'I had trouble understanding your request. Please try rephrasing it more clearly.'
+    },
+    {
+        needles: ['Unsupported metric type'],
+        message: () => 'This metric type is not yet supported for visualization. Please try a different metric.'
+    }
+];
 
 /**
  * Main application controller
@@ -34,9 +69,9 @@ export class AppController {
     @Version('1')
     @ApiBody({ type: ChatDto })
     @ApiOkResponse({ type: ChatResponseDto })
-    async chat(@Body(new ValidationPipe()) body: ChatDto): Promise<ChatResponseDto> {
+    async chat(@Body(validationPipe) body: ChatDto): Promise<ChatResponseDto> {
         const trace = startTrace('endpoint.chat', { body });
-        const startTime = Date.now();
+        const startTime = performance.now();
 
         try {
             // Step 1: Get data analysis for context (use provided dateRange or default)
@@ -55,10 +90,13 @@ export class AppController {
                 spec.groupBy
             );
 
-            const responseTime = Date.now() - startTime;
+            const responseTime = Math.round(performance.now() - startTime);
+            const metricsCount = dataAnalysis.availableMetrics.length;
 
-            // Step 4: Audit the chart generation
-            const requestId = await this.audit.logChartGeneration(
+            // Step 4: Audit the chart generation. The ID is minted up front
+            // so the response never waits on the audit write
+            const requestId = this.audit.createRequestId();
+            void this.audit.logChartGeneration(
                 body.prompt,
                 spec,
                 data,
@@ -66,12 +104,13 @@ export class AppController {
                 {
                     dataSource: 'Iris Finance API',
                     responseTimeMs: responseTime,
-                    metricsCount: dataAnalysis.availableMetrics.length
-                }
+                    metricsCount
+                },
+                requestId
             );
 
             // Log the data used for this chart (after requestId is available)
-            try {
+            if (DEBUG_CHART_DATA) try {
                 const seriesLabels = Array.isArray((data as any)?.values)
                     ? (data as any).values.map((s: any) => s.label)
                     : [];
@@ -127,7 +166,7 @@ export class AppController {
                 originalPrompt: body.prompt,
                 reasoning_summary: spec.reasoning_summary,
                 dataAnalysis: {
-                    totalMetrics: dataAnalysis.availableMetrics.length,
+                    totalMetrics: metricsCount,
                     suggestedChartTypes: dataAnalysis.suggestedChartTypes.map((s: any) => s.chartType)
                 }
             };
@@ -135,7 +174,7 @@ export class AppController {
             return result as any;
         } catch (error) {
             try { (trace as any)?.end({ level: 'ERROR', statusMessage: String(error) }); } catch { }
-            const responseTime = Date.now() - startTime;
+            const responseTime = Math.round(performance.now() - startTime);
             const errorMessage = error instanceof Error ? error.message : String(error);
 
             console.error('Chat endpoint error:', {
@@ -144,28 +183,15 @@ export class AppController {
                 responseTime
             });
 
-            if (errorMessage.includes('not found in dataset')) {
-                throw new Error(
-                    `I couldn't find the requested metric in the data. ${errorMessage.split('Available metrics:')[1] ?
-                        'Available metrics: ' + errorMessage.split('Available metrics:')[1] : ''}`
-                );
-            } else if (errorMessage.includes('Date range')) {
-                throw new Error(
-                    'Invalid date range format. Please use YYYY or YYYY-MM format (e.g., "2025" or "2025-06").'
-                );
-            } else if (errorMessage.includes('OpenAI') || errorMessage.includes('tool call')) {
-                throw new Error(
-                    'I had trouble understanding your request. Please try rephrasing it more clearly.'
-                );
-            } else if (errorMessage.includes('Unsupported metric type')) {
-                throw new Error(
-                    'This metric type is not yet supported for visualization. Please try a different metric.'
-                );
-            } else {
-                throw new Error(
-                    'Something went wrong while generating your chart. Please try again or contact support.'
-                );
+            for (const rule of CHAT_ERROR_RULES) {
+                if (rule.needles.some(needle => errorMessage.includes(needle))) {
+                    throw new Error(rule.message(errorMessage));
+                }
             }
+
+            throw new Error(
+                'Something went wrong while generating your chart. Please try again or contact support.'
+            );
         }
     }
 
@@ -201,24 +227,27 @@ export class AppController {
     @Version('1')
     @ApiBody({ type: DashboardDto })
     @ApiOkResponse({ type: DashboardResponseDto })
-    async generateDashboard(@Body(new ValidationPipe()) body: DashboardDto): Promise<DashboardResponseDto> {
+    async generateDashboard(@Body(validationPipe) body: DashboardDto): Promise<DashboardResponseDto> {
         const trace = startTrace('endpoint.dashboard', { body });
-        const startTime = Date.now();
+        const startTime = performance.now();
 
         try {
             const result = await this.dashboard.generateDashboard(body);
 
-            // Audit the dashboard generation
-            const requestId = await this.audit.logChartGeneration(
+            // Audit the dashboard generation, reusing the analysis the
+            // dashboard graph already computed instead of fetching it again
+            const requestId = this.audit.createRequestId();
+            void this.audit.logChartGeneration(
                 body.prompt,
                 { chartType: 'dashboard', metric: 'multiple', dateRange: body.dateRange || '2025-06' },
                 result.charts,
-                await this.metrics.getDataAnalysis(),
+                result.dataAnalysis,
                 {
                     dataSource: 'Iris Finance API',
-                    responseTimeMs: Date.now() - startTime,
+                    responseTimeMs: Math.round(performance.now() - startTime),
                     metricsCount: result.charts.length
-                }
+                },
+                requestId
             );
 
             // Return combined dashboard spec and data for the frontend from live Iris Finance API
@@ -263,8 +292,12 @@ export class AppController {
             //   requestId: string,                 // Unique ID like "1703123456789-abc123def"
             //   originalPrompt: string             // User's original input
             // }
+            // Built field-by-field so audit-only context (dataAnalysis) stays
+            // out of the payload and the response shape is explicit
             const response = {
-                ...result,
+                dashboardId: result.dashboardId,
+                charts: result.charts,
+                metadata: result.metadata,
                 requestId,
                 originalPrompt: body.prompt
             };
@@ -285,7 +318,7 @@ export class AppController {
      */
     @Post('feedback')
     @Version('1')
-    async submitFeedback(@Body(new ValidationPipe()) body: FeedbackDto) {
+    async submitFeedback(@Body(validationPipe) body: FeedbackDto) {
         try {
             await this.audit.addFeedback(
                 body.requestId,
@@ -327,7 +360,7 @@ export class AppController {
      */
     @Get('reasoning/status')
     @Version('1')
-    async getReasoningStatus() {
+    getReasoningStatus() {
         try {
             return this.reasoning.getReasoningStatus();
         } catch (error) {
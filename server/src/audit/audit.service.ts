@@ -1,5 +1,6 @@
 import { Injectable } from '@nestjs/common';
 import fs from 'fs/promises';
+import { randomBytes } from 'crypto';
 import path from 'path';
 
 /**
@@ -30,6 +31,35 @@ export interface AuditLogEntry {
     feedback?: ChartFeedback;
 }
 
+/**
+ * Summary row kept in the append-only NDJSON index; one line per chart
+ * request plus feedback delta lines carrying just requestId and rating
+ */
+interface AuditIndexRow {
+    requestId: string;
+    timestamp?: string;
+    chartType?: string;
+    responseTimeMs?: number;
+    rating?: number;
+}
+
+/**
+ * Both stats aggregates, computed together and cached between writes
+ */
+interface CombinedStats {
+    feedback: {
+        totalFeedback: number;
+        averageRating: number;
+        ratingDistribution: Record<number, number>;
+    };
+    audit: {
+        totalRequests: number;
+        todayRequests: number;
+        chartTypeBreakdown: Record<string, number>;
+        averageResponseTime: number;
+    };
+}
+
 /**
  * Interface for dashboard audit data formatted for PostgreSQL
  */
@@ -43,6 +73,11 @@ export interface DashboardAuditData {
     metadata: any; // JSONB
 }
 
+// Flush batching: wait briefly so concurrent requests coalesce into one
+// flush, and cap how many entries a single batch processes
+const FLUSH_DELAY_MS = 10;
+const FLUSH_BATCH_MAX = 64;
+
 /**
  * Service for auditing chart generation requests
  * Saves data used in chart generation for compliance/debugging and extension to saving to a database
@@ -50,9 +85,44 @@ export interface DashboardAuditData {
 @Injectable()
 export class AuditService {
     private auditDir = path.join(__dirname, '..', '..', 'audit-logs');
+    private indexPath = path.join(__dirname, '..', '..', 'audit-logs', 'audit-index.ndjson');
+
+    // Entries waiting to be written; flushed off the request path so
+    // chart responses are not blocked on audit file I/O
+    private pendingWrites: AuditLogEntry[] = [];
+    private flushScheduled = false;
+    private isFlushing = false;
+
+    // Entries of the in-flight batch whose files are already on disk but
+    // which have not left pendingWrites yet; feedback attached to one of
+    // these must also be merged into its file, since the queued object has
+    // already been serialized
+    private flushedPending = new Set<AuditLogEntry>();
+
+    // Resolves once the audit directory is known to exist; awaited instead
+    // of re-checking the directory on every write or stats call
+    private dirReady: Promise<void>;
+
+    // Resolves once the NDJSON index is known to exist. When the file is
+    // missing, the backfill from the chart files runs first, so an early
+    // feedback append can never create a partial index that masks the
+    // pre-existing history from the stats endpoints
+    private indexReady: Promise<void> | null = null;
+
+    // Every write to the index file is chained through this single writer,
+    // so the backfill rewrite and concurrent appends cannot interleave and
+    // silently drop each other's rows
+    private indexWriteChain: Promise<void> = Promise.resolve();
+
+    // Stats are cached until the next write: every logged chart or feedback
+    // bumps statsVersion, and a cached result is served while it matches
+    private statsVersion = 0;
+    private cachedStats: CombinedStats | null = null;
+    private cachedStatsVersion = -1;
+    private cachedStatsDay = '';
 
     constructor() {
-        this.ensureAuditDirectoryExists();
+        this.dirReady = this.ensureAuditDirectoryExists();
     }
 
     private async ensureAuditDirectoryExists(): Promise<void> {
@@ -66,10 +136,11 @@ export class AuditService {
 
     /**
      * Generate a unique request ID
+     * Public so callers can mint the ID up front and log without waiting
      */
-    private generateRequestId(): string {
+    createRequestId(): string {
         const timestamp = Date.now();
-        const random = Math.random().toString(36).substr(2, 9);
+        const random = randomBytes(5).toString('hex');
         return `${timestamp}-${random}`;
     }
 
@@ -85,9 +156,10 @@ export class AuditService {
             dataSource: string;
             responseTimeMs: number;
             metricsCount: number;
-        }
+        },
+        requestId?: string
     ): Promise<string> {
-        const requestId = this.generateRequestId();
+        requestId = requestId ?? this.createRequestId();
         const timestamp = new Date().toISOString();
 
         const auditEntry: AuditLogEntry = {
@@ -100,20 +172,212 @@ export class AuditService {
             metadata
         };
 
-        const filename = `chart-${requestId}.json`;
-        const filepath = path.join(this.auditDir, filename);
+        // Queue the write and return immediately; the entry is persisted
+        // by flushPendingWrites once the response has been sent
+        this.pendingWrites.push(auditEntry);
+        this.statsVersion++;
+        this.applyEntryToCachedStats(auditEntry);
+        this.scheduleFlush();
+
+        return requestId;
+    }
+
+    private scheduleFlush(): void {
+        if (this.flushScheduled) {
+            return;
+        }
+        this.flushScheduled = true;
+        // A short delay lets entries from concurrent requests pile up and
+        // flush as one batch with a single index append
+        setTimeout(() => {
+            this.flushPendingWrites().catch(error => {
+                console.error('Error flushing audit logs:', error);
+            });
+        }, FLUSH_DELAY_MS);
+    }
+
+    private async flushPendingWrites(): Promise<void> {
+        this.flushScheduled = false;
+
+        // One flush at a time: the drain loop below re-checks the queue, so
+        // entries pushed mid-flush are picked up by the running invocation.
+        // A second concurrent drain would splice front entries positionally
+        // that the other invocation never captured, losing their writes
+        if (this.isFlushing) {
+            return;
+        }
+        this.isFlushing = true;
 
         try {
-            await fs.writeFile(filepath, JSON.stringify(auditEntry, null, 2), 'utf-8');
-            console.log(`Audit log saved: ${filename}`);
+            await this.dirReady;
+            await this.drainPendingWrites();
+        } finally {
+            this.isFlushing = false;
+        }
 
-            return requestId;
+        // Re-arm for anything pushed while a skipped timer found the flush
+        // still running, instead of waiting for the next write to schedule
+        if (this.pendingWrites.length > 0) {
+            this.scheduleFlush();
+        }
+    }
+
+    private async drainPendingWrites(): Promise<void> {
+        while (this.pendingWrites.length > 0) {
+            // Entries stay in the queue until their files are on disk, so
+            // addFeedback can always find a request either queued or
+            // persisted — never in a gap between the two
+            const batch = this.pendingWrites.slice(0, FLUSH_BATCH_MAX);
+            const written: AuditLogEntry[] = [];
+
+            for (const entry of batch) {
+                const filename = `chart-${entry.requestId}.json`;
+                const filepath = path.join(this.auditDir, filename);
+
+                try {
+                    await fs.writeFile(filepath, JSON.stringify(entry), 'utf-8');
+                    written.push(entry);
+                    this.flushedPending.add(entry);
+                    console.log(`Audit log saved: ${filename}`);
+                } catch (error) {
+                    console.error('Error saving audit log:', error);
+                }
+            }
+
+            this.pendingWrites.splice(0, batch.length);
+            for (const entry of written) {
+                this.flushedPending.delete(entry);
+            }
+
+            // Index lines are built after the batch leaves the queue, so a
+            // rating attached to a queued entry mid-flush still lands here
+            const indexLines = written.map(entry => JSON.stringify({
+                requestId: entry.requestId,
+                timestamp: entry.timestamp,
+                chartType: entry.chartSpec?.chartType,
+                responseTimeMs: entry.metadata.responseTimeMs,
+                rating: entry.feedback?.rating
+            } as AuditIndexRow) + '\n');
+
+            if (indexLines.length > 0) {
+                try {
+                    await this.ensureIndexExists();
+                    await this.queueIndexWrite(() =>
+                        fs.appendFile(this.indexPath, indexLines.join(''), 'utf-8')
+                    );
+                } catch (error) {
+                    console.error('Error appending audit index:', error);
+                }
+            }
+        }
+    }
+
+    /**
+     * Run one index write after every previously queued one has settled.
+     * The chain swallows failures so one bad write cannot wedge it; the
+     * caller still sees the rejection on the returned promise.
+     */
+    private queueIndexWrite(write: () => Promise<void>): Promise<void> {
+        const queued = this.indexWriteChain.then(write);
+        this.indexWriteChain = queued.catch(() => undefined);
+        return queued;
+    }
+
+    /**
+     * Ensure the index file exists before anything appends to it, rebuilding
+     * it from the chart files when it is missing (analogous to dirReady).
+     * A failed init is retried on the next call instead of being cached.
+     */
+    private ensureIndexExists(): Promise<void> {
+        if (!this.indexReady) {
+            this.indexReady = this.initIndex().catch(error => {
+                this.indexReady = null;
+                throw error;
+            });
+        }
+        return this.indexReady;
+    }
+
+    private async initIndex(): Promise<void> {
+        await this.dirReady;
+        try {
+            await fs.access(this.indexPath);
         } catch (error) {
-            console.error('Error saving audit log:', error);
-            throw new Error('Failed to save audit log');
+            // No index yet: backfill it from the existing chart files, so
+            // appends land on the full history rather than seeding an index
+            // that holds only the newest rows
+            await this.scanAuditFiles();
         }
     }
 
+    /**
+     * Append one summary line to the NDJSON index. Stats endpoints read this
+     * small file instead of opening every chart-*.json payload.
+     */
+    private async appendIndexRow(row: AuditIndexRow): Promise<void> {
+        await this.ensureIndexExists();
+        await this.queueIndexWrite(() =>
+            fs.appendFile(this.indexPath, JSON.stringify(row) + '\n', 'utf-8')
+        );
+    }
+
+    /**
+     * Load the index into one row per request, merging feedback delta lines
+     * onto their original rows. Returns null when the index does not exist
+     * yet, in which case callers fall back to scanning the audit files.
+     */
+    private async readIndex(): Promise<Map<string, AuditIndexRow> | null> {
+        let content: string;
+        try {
+            content = await fs.readFile(this.indexPath, 'utf-8');
+        } catch (error) {
+            return null;
+        }
+
+        const rows = new Map<string, AuditIndexRow>();
+        for (const line of content.split('\n')) {
+            if (!line) continue;
+            try {
+                const row: AuditIndexRow = JSON.parse(line);
+                const existing = rows.get(row.requestId);
+                if (existing) {
+                    Object.assign(existing, row);
+                } else {
+                    rows.set(row.requestId, row);
+                }
+            } catch (error) {
+                // Skip corrupt lines (e.g. from a partial write)
+                continue;
+            }
+        }
+        return rows;
+    }
+
+    /**
+     * Read and parse a batch of audit files with a bounded number of reads
+     * in flight, rather than awaiting each file before starting the next.
+     * Unreadable or corrupt files are skipped.
+     */
+    private async readAuditEntries(files: string[], concurrency: number = 16): Promise<AuditLogEntry[]> {
+        const entries: AuditLogEntry[] = [];
+        let next = 0;
+
+        const worker = async () => {
+            while (next < files.length) {
+                const file = files[next++];
+                try {
+                    const data = await fs.readFile(path.join(this.auditDir, file), 'utf-8');
+                    entries.push(JSON.parse(data));
+                } catch (error) {
+                    // Skip invalid files
+                }
+            }
+        };
+
+        await Promise.all(Array.from({ length: Math.min(concurrency, files.length) }, worker));
+        return entries;
+    }
+
     /**
      * Add feedback to an existing audit log entry
      */
@@ -130,61 +394,303 @@ export class AuditService {
             chartId
         };
 
+        // If the entry is still queued, attach feedback in memory before it hits disk
+        const pending = this.pendingWrites.find(entry => entry.requestId === requestId);
+        if (pending) {
+            const previousRating = pending.feedback?.rating;
+            pending.feedback = feedback;
+            this.statsVersion++;
+            this.applyFeedbackToCachedStats(rating, previousRating);
+
+            // The in-flight flush may have serialized this entry already,
+            // in which case the in-memory attach no longer reaches its
+            // file; fold the feedback in as on the persisted path. Stats
+            // were patched above, so the merge skips its own patch
+            if (this.flushedPending.has(pending)) {
+                const filename = `chart-${requestId}.json`;
+                const filepath = path.join(this.auditDir, filename);
+                setImmediate(() => {
+                    this.mergeFeedbackIntoFile(filepath, filename, feedback, false).catch(error => {
+                        console.error('Error merging feedback into audit log:', error);
+                    });
+                });
+            }
+            return;
+        }
+
         // Update the audit log file
         const filename = `chart-${requestId}.json`;
         const filepath = path.join(this.auditDir, filename);
 
         try {
-            const existingData = await fs.readFile(filepath, 'utf-8');
-            const auditEntry: AuditLogEntry = JSON.parse(existingData);
-
-            auditEntry.feedback = feedback;
-
-            await fs.writeFile(filepath, JSON.stringify(auditEntry, null, 2), 'utf-8');
-            console.log(`Feedback added to audit log: ${filename}`);
+            // Only verify the entry exists on the request path; parsing and
+            // rewriting the (potentially large) payload happens off it
+            await fs.access(filepath);
+            await this.appendIndexRow({ requestId, rating });
+            this.statsVersion++;
         } catch (error) {
             console.error('Error adding feedback to audit log:', error);
             throw new Error('Failed to save feedback');
         }
+
+        setImmediate(() => {
+            this.mergeFeedbackIntoFile(filepath, filename, feedback).catch(error => {
+                console.error('Error merging feedback into audit log:', error);
+            });
+        });
     }
 
     /**
-     * Get feedback statistics across all audit logs
+     * Fold a feedback object into its chart file, deferred so the feedback
+     * endpoint does not pay for parsing and rewriting the full payload.
+     * The cached stats patch also lives here because only the merge knows
+     * the previous rating when feedback is resubmitted.
      */
-    async getFeedbackStats(): Promise<{
-        totalFeedback: number;
-        averageRating: number;
-        ratingDistribution: Record<number, number>;
-    }> {
+    private async mergeFeedbackIntoFile(filepath: string, filename: string, feedback: ChartFeedback, patchStats: boolean = true): Promise<void> {
+        const existingData = await fs.readFile(filepath, 'utf-8');
+        const auditEntry: AuditLogEntry = JSON.parse(existingData);
+
+        const previousRating = auditEntry.feedback?.rating;
+        auditEntry.feedback = feedback;
+
+        await fs.writeFile(filepath, JSON.stringify(auditEntry), 'utf-8');
+        if (patchStats) {
+            this.applyFeedbackToCachedStats(feedback.rating, previousRating);
+        }
+        console.log(`Feedback added to audit log: ${filename}`);
+    }
+
+    /**
+     * One pass over the audit files computing both the feedback and audit
+     * aggregates, shared by the two stats endpoints so neither triggers its
+     * own directory scan when the index is unavailable.
+     */
+    private async scanAuditFiles(): Promise<CombinedStats> {
+        // One listing pass: skip non-files and collect the today count
+        // alongside the filename filter instead of re-filtering the list.
+        // Filenames are chart-<ms>-<suffix>.json, so "today" is a numeric
+        // range check on the leading epoch-millisecond timestamp
+        const dirents = await fs.readdir(this.auditDir, { withFileTypes: true });
+        const msStart = new Date().setUTCHours(0, 0, 0, 0);
+        const msEnd = msStart + 86_400_000;
+        const auditFiles: string[] = [];
+        let todayRequests = 0;
+
+        for (const dirent of dirents) {
+            const name = dirent.name;
+            if (!dirent.isFile() || !name.startsWith('chart-') || !name.endsWith('.json')) {
+                continue;
+            }
+            auditFiles.push(name);
+            const ts = Number(name.slice('chart-'.length, name.indexOf('-', 'chart-'.length)));
+            if (ts >= msStart && ts < msEnd) {
+                todayRequests++;
+            }
+        }
+
+        let totalFeedback = 0;
+        let ratingSum = 0;
+        const ratingDistribution: Record<number, number> = { 1: 0, 2: 0, 3: 0, 4: 0, 5: 0 };
+
+        const chartTypeBreakdown: Record<string, number> = {};
+        let totalResponseTime = 0;
+        let samples = 0;
+
+        const indexRows: AuditIndexRow[] = [];
+
+        for (const entry of await this.readAuditEntries(auditFiles)) {
+            if (entry.feedback) {
+                totalFeedback++;
+                ratingSum += entry.feedback.rating;
+                ratingDistribution[entry.feedback.rating]++;
+            }
+
+            const chartType = entry.chartSpec?.chartType || 'unknown';
+            chartTypeBreakdown[chartType] = (chartTypeBreakdown[chartType] || 0) + 1;
+
+            if (typeof entry.metadata?.responseTimeMs === 'number') {
+                totalResponseTime += entry.metadata.responseTimeMs;
+                samples++;
+            }
+
+            indexRows.push({
+                requestId: entry.requestId,
+                timestamp: entry.timestamp,
+                chartType: entry.chartSpec?.chartType,
+                responseTimeMs: entry.metadata?.responseTimeMs,
+                rating: entry.feedback?.rating
+            });
+        }
+
+        // Backfill the NDJSON index from the summary fields just extracted,
+        // so the next stats call never has to parse full payloads again.
+        // scanAuditFiles only runs when the index file is missing.
         try {
-            const files = await fs.readdir(this.auditDir);
-            const auditFiles = files.filter(f => f.startsWith('chart-') && f.endsWith('.json'));
+            await this.queueIndexWrite(() =>
+                fs.writeFile(
+                    this.indexPath,
+                    indexRows.map(row => JSON.stringify(row) + '\n').join(''),
+                    'utf-8'
+                )
+            );
+        } catch (error) {
+            console.error('Error backfilling audit index:', error);
+        }
 
-            let totalFeedback = 0;
-            let ratingSum = 0;
-            const ratingDistribution: Record<number, number> = { 1: 0, 2: 0, 3: 0, 4: 0, 5: 0 };
+        return {
+            feedback: {
+                totalFeedback,
+                averageRating: totalFeedback > 0 ? ratingSum / totalFeedback : 0,
+                ratingDistribution
+            },
+            audit: {
+                totalRequests: auditFiles.length,
+                todayRequests,
+                chartTypeBreakdown,
+                averageResponseTime: samples > 0 ? totalResponseTime / samples : 0
+            }
+        };
+    }
 
-            for (const file of auditFiles) {
-                try {
-                    const data = await fs.readFile(path.join(this.auditDir, file), 'utf-8');
-                    const entry: AuditLogEntry = JSON.parse(data);
+    /**
+     * True when the cached stats were current up to the write that just
+     * bumped statsVersion, i.e. they can be patched in place
+     */
+    private cachedStatsAreCurrent(): boolean {
+        return this.cachedStats !== null &&
+            this.cachedStatsVersion === this.statsVersion - 1 &&
+            this.cachedStatsDay === new Date().toISOString().split('T')[0];
+    }
 
-                    if (entry.feedback) {
-                        totalFeedback++;
-                        ratingSum += entry.feedback.rating;
-                        ratingDistribution[entry.feedback.rating]++;
-                    }
-                } catch (error) {
-                    // Skip invalid files
-                    continue;
-                }
+    /**
+     * Fold a newly logged entry into the cached aggregates so the first
+     * stats call after a write does not trigger a recompute
+     */
+    private applyEntryToCachedStats(entry: AuditLogEntry): void {
+        if (!this.cachedStatsAreCurrent()) {
+            return;
+        }
+
+        const audit = this.cachedStats!.audit;
+        // Every logged entry carries a response time, so the sample count
+        // behind the running average equals the previous request total
+        audit.averageResponseTime =
+            (audit.averageResponseTime * audit.totalRequests + entry.metadata.responseTimeMs) /
+            (audit.totalRequests + 1);
+        audit.totalRequests++;
+        audit.todayRequests++;
+        const chartType = entry.chartSpec?.chartType || 'unknown';
+        audit.chartTypeBreakdown[chartType] = (audit.chartTypeBreakdown[chartType] || 0) + 1;
+        this.cachedStatsVersion = this.statsVersion;
+    }
+
+    /**
+     * Fold a feedback write into the cached aggregates, replacing the
+     * previous rating when feedback is resubmitted for the same request
+     */
+    private applyFeedbackToCachedStats(rating: number, previousRating?: number): void {
+        if (!this.cachedStatsAreCurrent()) {
+            return;
+        }
+
+        const feedback = this.cachedStats!.feedback;
+        let ratingSum = feedback.averageRating * feedback.totalFeedback;
+
+        if (previousRating) {
+            ratingSum -= previousRating;
+            feedback.ratingDistribution[previousRating]--;
+        } else {
+            feedback.totalFeedback++;
+        }
+
+        ratingSum += rating;
+        feedback.ratingDistribution[rating] = (feedback.ratingDistribution[rating] || 0) + 1;
+        feedback.averageRating = feedback.totalFeedback > 0 ? ratingSum / feedback.totalFeedback : 0;
+        this.cachedStatsVersion = this.statsVersion;
+    }
+
+    /**
+     * Aggregate both stats from the NDJSON index rows in one pass
+     */
+    private aggregateFromIndex(index: Map<string, AuditIndexRow>): CombinedStats {
+        let totalFeedback = 0;
+        let ratingSum = 0;
+        const ratingDistribution: Record<number, number> = { 1: 0, 2: 0, 3: 0, 4: 0, 5: 0 };
+
+        const today = new Date().toISOString().split('T')[0];
+        const chartTypeBreakdown: Record<string, number> = {};
+        let todayRequests = 0;
+        let totalResponseTime = 0;
+        let samples = 0;
+
+        for (const row of index.values()) {
+            if (row.rating) {
+                totalFeedback++;
+                ratingSum += row.rating;
+                ratingDistribution[row.rating]++;
+            }
+            if (row.timestamp?.startsWith(today)) {
+                todayRequests++;
+            }
+            const chartType = row.chartType || 'unknown';
+            chartTypeBreakdown[chartType] = (chartTypeBreakdown[chartType] || 0) + 1;
+            if (typeof row.responseTimeMs === 'number') {
+                totalResponseTime += row.responseTimeMs;
+                samples++;
             }
+        }
 
-            return {
+        return {
+            feedback: {
                 totalFeedback,
                 averageRating: totalFeedback > 0 ? ratingSum / totalFeedback : 0,
                 ratingDistribution
-            };
+            },
+            audit: {
+                totalRequests: index.size,
+                todayRequests,
+                chartTypeBreakdown,
+                averageResponseTime: samples > 0 ? totalResponseTime / samples : 0
+            }
+        };
+    }
+
+    /**
+     * Return the cached stats when nothing has been written since they were
+     * computed (and the day has not rolled over, which would stale
+     * todayRequests); otherwise recompute from the index or a full scan.
+     */
+    private async getStats(): Promise<CombinedStats> {
+        const today = new Date().toISOString().split('T')[0];
+        if (
+            this.cachedStats &&
+            this.cachedStatsVersion === this.statsVersion &&
+            this.cachedStatsDay === today
+        ) {
+            return this.cachedStats;
+        }
+
+        const version = this.statsVersion;
+        await this.ensureIndexExists();
+        const index = await this.readIndex();
+        const stats = index ? this.aggregateFromIndex(index) : await this.scanAuditFiles();
+
+        this.cachedStats = stats;
+        this.cachedStatsVersion = version;
+        this.cachedStatsDay = today;
+        return stats;
+    }
+
+    /**
+     * Get feedback statistics across all audit logs
+     */
+    async getFeedbackStats(): Promise<{
+        totalFeedback: number;
+        averageRating: number;
+        ratingDistribution: Record<number, number>;
+    }> {
+        try {
+            return (await this.getStats()).feedback;
         } catch (error) {
             console.error('Error calculating feedback stats:', error);
             return { totalFeedback: 0, averageRating: 0, ratingDistribution: { 1: 0, 2: 0, 3: 0, 4: 0, 5: 0 } };
@@ -201,41 +707,9 @@ export class AuditService {
         averageResponseTime: number;
     }> {
         try {
-            await this.ensureAuditDirectoryExists();
-
-            const files = await fs.readdir(this.auditDir);
-            const chartFiles = files.filter(f => f.startsWith('chart-') && f.endsWith('.json'));
-
-            const today = new Date().toISOString().split('T')[0];
-            const todayFiles = chartFiles.filter(f => f.includes(today));
+            await this.dirReady;
 
-            const sampleSize = Math.min(100, chartFiles.length);
-            const sampleFiles = chartFiles.slice(-sampleSize);
-
-            const chartTypeBreakdown: Record<string, number> = {};
-            let totalResponseTime = 0;
-
-            for (const file of sampleFiles) {
-                try {
-                    const filePath = path.join(this.auditDir, file);
-                    const content = await fs.readFile(filePath, 'utf-8');
-                    const entry: AuditLogEntry = JSON.parse(content);
-                    const chartType = entry.chartSpec.chartType;
-
-                    chartTypeBreakdown[chartType] = (chartTypeBreakdown[chartType] || 0) + 1;
-
-                    totalResponseTime += entry.metadata.responseTimeMs;
-                } catch (error) {
-                    console.error(`Error reading audit file ${file}:`, error);
-                }
-            }
-
-            return {
-                totalRequests: chartFiles.length,
-                todayRequests: todayFiles.length,
-                chartTypeBreakdown,
-                averageResponseTime: sampleFiles.length > 0 ? totalResponseTime / sampleFiles.length : 0
-            };
+            return (await this.getStats()).audit;
         } catch (error) {
             console.error('Error getting audit stats:', error);
             return {
@@ -264,7 +738,7 @@ export class AuditService {
         },
         requirements?: any
     ): Promise<DashboardAuditData> {
-        const requestId = this.generateRequestId();
+        const requestId = this.createRequestId();
 
         // Extract chart schemas for JSONB storage
         const chartSchemas = dashboardResult.charts.map((chart: any) => ({
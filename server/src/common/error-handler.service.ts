@@ -11,12 +11,21 @@ export interface ErrorContext {
     metadata?: Record<string, any>;
 }
 
+/**
+ * Ordered log levels used to gate non-error logging on the request path
+ */
+const LOG_LEVELS: Record<string, number> = { debug: 0, info: 1, warning: 2, error: 3 };
+
 /**
  * Centralized error handling service
  * Provides consistent error handling, logging, and response formatting across the application
  */
 @Injectable()
 export class ErrorHandlerService {
+    // LOG_LEVEL=warning (or error) in production skips info-level context
+    // object construction and console I/O inside request handlers
+    private readonly minLevel: number =
+        LOG_LEVELS[(process.env.LOG_LEVEL || 'info').toLowerCase()] ?? LOG_LEVELS.info;
 
     /**
      * Handle API-related errors with consistent formatting and logging
@@ -154,6 +163,10 @@ export class ErrorHandlerService {
      * @param context - Additional context
      */
     logInfo(operation: string, message: string, context?: ErrorContext): void {
+        if (this.minLevel > LOG_LEVELS.info) {
+            return;
+        }
+
         const logContext = {
             operation,
             message,
@@ -172,6 +185,10 @@ export class ErrorHandlerService {
      * @param context - Additional context
      */
     logWarning(operation: string, message: string, context?: ErrorContext): void {
+        if (this.minLevel > LOG_LEVELS.warning) {
+            return;
+        }
+
         const logContext = {
             operation,
             message,
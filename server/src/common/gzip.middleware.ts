@@ -0,0 +1,80 @@
+import { gzip } from 'zlib';
+
+// Compress only when the payload is big enough for the deflate pass to pay
+// for itself; chart and dashboard JSON bodies are typically far larger
+const THRESHOLD_BYTES = 1024;
+
+function toBuffer(chunk: any, encoding?: BufferEncoding): Buffer {
+    return Buffer.isBuffer(chunk) ? chunk : Buffer.from(chunk, encoding);
+}
+
+/**
+ * Minimal gzip middleware built on node's zlib, so response compression does
+ * not pull an external package into the dependency tree. The body is
+ * buffered (chart and dashboard payloads are built in memory anyway) and
+ * gzipped when the client accepts gzip and the body clears the threshold.
+ */
+export function gzipResponses(req: any, res: any, next: () => void): void {
+    const acceptEncoding = String(req.headers['accept-encoding'] || '');
+    if (req.method === 'HEAD' || !acceptEncoding.includes('gzip')) {
+        next();
+        return;
+    }
+
+    const chunks: Buffer[] = [];
+    const originalWrite = res.write;
+    const originalEnd = res.end;
+
+    res.write = function (chunk: any, encoding?: any, callback?: any) {
+        if (typeof encoding === 'function') {
+            callback = encoding;
+            encoding = undefined;
+        }
+        if (chunk) {
+            chunks.push(toBuffer(chunk, encoding));
+        }
+        if (callback) {
+            callback();
+        }
+        return true;
+    };
+
+    res.end = function (chunk?: any, encoding?: any, callback?: any) {
+        if (typeof chunk === 'function') {
+            callback = chunk;
+            chunk = undefined;
+        } else if (typeof encoding === 'function') {
+            callback = encoding;
+            encoding = undefined;
+        }
+        if (chunk) {
+            chunks.push(toBuffer(chunk, encoding));
+        }
+
+        res.write = originalWrite;
+        res.end = originalEnd;
+        const body = chunks.length === 1 ? chunks[0] : Buffer.concat(chunks);
+
+        if (body.length < THRESHOLD_BYTES || res.getHeader('content-encoding')) {
+            res.end(body, callback);
+            return res;
+        }
+
+        gzip(body, (error: Error | null, compressed: Buffer) => {
+            // On error, or a body the deflate pass did not shrink, send the
+            // original bytes with the headers untouched
+            if (error || compressed.length >= body.length) {
+                res.end(body, callback);
+                return;
+            }
+            res.setHeader('content-encoding', 'gzip');
+            res.setHeader('content-length', compressed.length);
+            const vary = res.getHeader('vary');
+            res.setHeader('vary', vary ? `${vary}, Accept-Encoding` : 'Accept-Encoding');
+            res.end(compressed, callback);
+        });
+        return res;
+    };
+
+    next();
+}
@@ -1,8 +1,12 @@
+import { randomBytes } from "crypto";
 import { START, END, StateGraph, Annotation } from "@langchain/langgraph";
 import { DashboardDto, DashboardChartDto } from "./dto/chat.dto";
 import { MetricsService } from "./data/metrics.service";
 import { MetricInfo } from "./data/data-analysis.service";
 
+// Matches the flag in app.controller.ts: per-chart data logging is opt-in
+const DEBUG_CHART_DATA = process.env.DEBUG_CHART_DATA === '1';
+
 export type DashboardGraphDeps = {
     metricsService: MetricsService;
     // Required helpers injected from DashboardService (no fallbacks)
@@ -77,7 +81,7 @@ export function createDashboardGraph(deps: DashboardGraphDeps) {
         for (const spec of state.chartSpecs) {
             const data = await metricsService.slice(spec.metric, spec.dateRange, spec.groupBy);
             // Server-side logging of chart data used per dashboard chart
-            try {
+            if (DEBUG_CHART_DATA) try {
                 const seriesLabels = Array.isArray((data as any)?.values)
                     ? (data as any).values.map((s: any) => s.label)
                     : [];
@@ -134,11 +138,19 @@ export function createDashboardGraph(deps: DashboardGraphDeps) {
     return builder.compile();
 }
 
+// Compiled graphs are cached per deps object so repeat requests reuse the
+// same compiled StateGraph instead of rebuilding it on every invocation
+const compiledGraphCache = new WeakMap<DashboardGraphDeps, ReturnType<typeof createDashboardGraph>>();
+
 export async function runDashboardGraph(
     request: DashboardDto,
     deps: DashboardGraphDeps
 ) {
-    const graph = createDashboardGraph(deps);
+    let graph = compiledGraphCache.get(deps);
+    if (!graph) {
+        graph = createDashboardGraph(deps);
+        compiledGraphCache.set(deps, graph);
+    }
     const result = await graph.invoke({
         prompt: request.prompt,
         dateRange: request.dateRange,
@@ -153,7 +165,10 @@ export async function runDashboardGraph(
             totalCharts: result.charts?.length ?? 0,
             responseTimeMs: result.responseTimeMs,
         },
-        requestId: `dash_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`,
+        // Analysis computed inside the graph, surfaced so callers (audit
+        // logging) don't have to re-fetch it
+        dataAnalysis: result.dataAnalysis,
+        requestId: `dash_${Date.now()}_${randomBytes(5).toString('hex')}`,
     };
 }
 
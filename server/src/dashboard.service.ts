@@ -1,4 +1,5 @@
 import { Injectable } from '@nestjs/common';
+import { randomBytes } from 'crypto';
 import { OpenAiService } from './openai.service';
 import { MetricsService } from './data/metrics.service';
 import { MetricInfo } from './data/data-analysis.service';
@@ -6,6 +7,32 @@ import { ReasoningService } from './reasoning.service';
 import { DashboardDto, DashboardChartDto } from './dto/chat.dto';
 import { runDashboardGraph } from './dashboard.graph';
 
+// Hoisted so generateChartTitle does not rebuild them per call
+const CAMEL_RE = /([A-Z])/g;
+
+const TYPE_MAP: Record<string, string> = {
+    'line': 'Trends',
+    'bar': 'Comparison',
+    'stacked-bar': 'Breakdown',
+    'heatmap': 'Pattern Analysis',
+    'waterfall': 'Impact Analysis'
+};
+
+// Titles repeat across dashboards for common metric/chart pairs; cap the
+// memo so a flood of one-off metric names cannot grow it unbounded
+const TITLE_CACHE_MAX = 512;
+const titleCache = new Map<string, string>();
+
+// Per-analysis cache of the non-scalar metric list; keyed weakly on the
+// analysis object so it drops out together with the metrics cache entry
+const visualizableCache = new WeakMap<object, MetricInfo[]>();
+
+// Ranked-metric results per analysis, keyed by prompt and chart budget.
+// Repeated prompts against the same cached analysis skip the reasoning
+// pass entirely; the outer WeakMap ties lifetime to the analysis object
+const RELATED_CACHE_MAX = 256;
+const relatedMetricsCache = new WeakMap<object, Map<string, MetricInfo[]>>();
+
 interface DashboardResponse {
     dashboardId: string;
     charts: DashboardChartDto[];
@@ -13,6 +40,7 @@ interface DashboardResponse {
         totalCharts: number;
         responseTimeMs: number;
     };
+    dataAnalysis: any;
     requestId: string;
 }
 
@@ -21,6 +49,16 @@ interface DashboardResponse {
  */
 @Injectable()
 export class DashboardService {
+    // Built once so runDashboardGraph can reuse the compiled graph across requests
+    private readonly graphDeps = {
+        metricsService: this.metricsService,
+        identifyRelatedMetrics: this.identifyRelatedMetrics.bind(this),
+        generateChartSpecs: this.generateChartSpecs.bind(this),
+        formatTitle: this.generateChartTitle.bind(this),
+        calcSpan: this.calculateChartSpan.bind(this),
+        generateDashboardId: this.generateDashboardId.bind(this),
+    };
+
     constructor(
         private openAiService: OpenAiService,
         private metricsService: MetricsService,
@@ -29,23 +67,33 @@ export class DashboardService {
 
     async generateDashboard(request: DashboardDto): Promise<DashboardResponse> {
         // Use LangGraph-based orchestration for dashboard generation
-        const result = await runDashboardGraph(request, {
-            metricsService: this.metricsService,
-            identifyRelatedMetrics: this.identifyRelatedMetrics.bind(this),
-            generateChartSpecs: this.generateChartSpecs.bind(this),
-            formatTitle: this.generateChartTitle.bind(this),
-            calcSpan: this.calculateChartSpan.bind(this),
-            generateDashboardId: this.generateDashboardId.bind(this),
-        });
+        const result = await runDashboardGraph(request, this.graphDeps);
 
         return result as DashboardResponse;
     }
 
     public async identifyRelatedMetrics(prompt: string, dataAnalysis: any, maxCharts: number = 5): Promise<MetricInfo[]> {
-        // Filter out scalar metrics for dashboards - need system to handle in future
-        const visualizableMetrics = dataAnalysis.availableMetrics.filter((m: MetricInfo) =>
-            m.type !== 'scalar'
-        );
+        let byPrompt = relatedMetricsCache.get(dataAnalysis);
+        if (!byPrompt) {
+            byPrompt = new Map();
+            relatedMetricsCache.set(dataAnalysis, byPrompt);
+        }
+        const cacheKey = `${maxCharts}|${prompt.toLowerCase().trim()}`;
+        const cached = byPrompt.get(cacheKey);
+        if (cached) {
+            return cached;
+        }
+
+        // Filter out scalar metrics for dashboards - need system to handle in future.
+        // The same analysis object serves many requests while cached upstream,
+        // so the filtered list is computed once per analysis
+        let visualizableMetrics = visualizableCache.get(dataAnalysis);
+        if (!visualizableMetrics) {
+            visualizableMetrics = dataAnalysis.availableMetrics.filter((m: MetricInfo) =>
+                m.type !== 'scalar'
+            );
+            visualizableCache.set(dataAnalysis, visualizableMetrics);
+        }
 
         // Use centralized reasoning service for comprehensive analysis
         const analysis = this.reasoningService.analyzeAndRankMetrics(prompt, visualizableMetrics, maxCharts);
@@ -66,23 +114,28 @@ export class DashboardService {
             metrics.findIndex(m => m.name === metric.name) === index
         );
 
+        if (byPrompt.size >= RELATED_CACHE_MAX) {
+            byPrompt.clear();
+        }
+        byPrompt.set(cacheKey, uniqueMetrics);
+
         return uniqueMetrics;
     }
 
     public async generateChartSpecs(request: DashboardDto, metrics: MetricInfo[], dataAnalysis: any): Promise<any[]> {
-        const specs = [];
-
-        for (const metric of metrics) {
+        // Fan out the per-metric OpenAI calls so dashboard latency tracks the
+        // slowest call rather than the sum of all of them
+        const rawSpecs = await Promise.all(metrics.map(metric => {
             // Create a contextual prompt for this specific metric
             const metricPrompt = this.buildContextualMetricPrompt(metric, request.prompt, dataAnalysis);
+            return this.openAiService.prompt(metricPrompt, dataAnalysis);
+        }));
 
-            const spec = await this.openAiService.prompt(metricPrompt, dataAnalysis);
-            specs.push({
-                ...spec,
-                title: this.generateChartTitle(metric.name, spec.chartType),
-                dateRange: request.dateRange || spec.dateRange
-            });
-        }
+        const specs = rawSpecs.map((spec, i) => ({
+            ...spec,
+            title: this.generateChartTitle(metrics[i].name, spec.chartType),
+            dateRange: request.dateRange || spec.dateRange
+        }));
 
         // Remove duplicates based on metric + chart type + date range combination
         return this.deduplicateChartSpecs(specs);
@@ -90,21 +143,26 @@ export class DashboardService {
 
 
     public generateChartTitle(metricName: string, chartType: string): string {
+        const cacheKey = `${metricName}|${chartType}`;
+        const cached = titleCache.get(cacheKey);
+        if (cached !== undefined) {
+            return cached;
+        }
+
         const cleanName = metricName.split('.').pop() || metricName;
         const formattedName = cleanName
-            .replace(/([A-Z])/g, ' $1')
+            .replace(CAMEL_RE, ' $1')
             .replace(/^./, str => str.toUpperCase())
             .trim();
 
-        const typeMap = {
-            'line': 'Trends',
-            'bar': 'Comparison',
-            'stacked-bar': 'Breakdown',
-            'heatmap': 'Pattern Analysis',
-            'waterfall': 'Impact Analysis'
-        };
+        const title = `${formattedName} ${TYPE_MAP[chartType] || 'Analysis'}`;
+
+        if (titleCache.size >= TITLE_CACHE_MAX) {
+            titleCache.clear();
+        }
+        titleCache.set(cacheKey, title);
 
-        return `${formattedName} ${typeMap[chartType as keyof typeof typeMap] || 'Analysis'}`;
+        return title;
     }
 
     public calculateChartSpan(chartType: string, totalCharts: number): number {
@@ -114,7 +172,7 @@ export class DashboardService {
 
 
     public generateDashboardId(): string {
-        return `dashboard_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+        return `dashboard_${Date.now()}_${randomBytes(5).toString('hex')}`;
     }
 
     /**
@@ -2,6 +2,32 @@ import { Injectable } from '@nestjs/common';
 import { MetricInfo } from './data-analysis.service';
 import { DateFilterUtil } from '../utils/date-filter.util';
 
+// Dotted metric paths are stable per dataset and repeat across requests, so
+// their split form is cached; every strategy shares this one helper instead
+// of carrying an identical private copy
+const PATH_SEGMENTS_CACHE_MAX = 1024;
+const pathSegmentsCache = new Map<string, string[]>();
+
+function getNestedValue(obj: any, path: string): any {
+    let segments = pathSegmentsCache.get(path);
+    if (!segments) {
+        if (pathSegmentsCache.size >= PATH_SEGMENTS_CACHE_MAX) {
+            pathSegmentsCache.clear();
+        }
+        segments = path.split('.');
+        pathSegmentsCache.set(path, segments);
+    }
+
+    // One property read per hop; the previous reduce probed each key twice
+    // (existence test plus re-read) through a closure call per segment
+    let current = obj;
+    for (const key of segments) {
+        if (!current) return undefined;
+        current = current[key];
+    }
+    return current;
+}
+
 /**
  * Common chart data format returned by all slicing strategies
  */
@@ -25,32 +51,41 @@ export interface SlicingStrategy {
  */
 export class TimeSeriesSlicingStrategy implements SlicingStrategy {
     slice(data: any, metricInfo: MetricInfo, dateRange?: string): ChartData {
-        const rawData = this.getNestedValue(data, metricInfo.name);
+        const rawData = getNestedValue(data, metricInfo.name);
 
         if (!rawData || !Array.isArray(rawData)) {
             return { dates: [], values: [] };
         }
 
-        // Filter by date range if specified
-        const filteredData = DateFilterUtil.filterByDateRange(rawData, 'date', dateRange);
+        // Filter and project in one pass instead of building an intermediate
+        // filtered array and mapping it twice
+        const inRange = DateFilterUtil.compileDatePredicate(dateRange);
+        const dates: string[] = [];
+        const values: number[] = [];
+
+        for (const item of rawData as any[]) {
+            if (inRange && !(item.date && inRange(item.date))) continue;
+            dates.push(item.date);
+            values.push(item.value);
+        }
 
         // Convert to AG Chart format
         return {
-            dates: filteredData.map((item: any) => item.date),
+            dates,
             values: [{
                 label: metricInfo.description,
-                values: filteredData.map((item: any) => item.value)
+                values
             }]
         };
     }
-
-    private getNestedValue(obj: any, path: string): any {
-        return path.split('.').reduce((current, key) => {
-            return current && current[key] !== undefined ? current[key] : undefined;
-        }, obj);
-    }
 }
 
+// Kept-index lists per grouped-series payload, keyed weakly on its dates
+// array so the index is dropped together with the cached dataset it was
+// built from. Dashboards slice the same series repeatedly with a handful
+// of ranges; after the first pass each repeat is a direct gather
+const dateIndicesCache = new WeakMap<object, Map<string, number[]>>();
+
 /**
  * Strategy for slicing grouped series data
  */
@@ -61,7 +96,7 @@ export class GroupedSeriesSlicingStrategy implements SlicingStrategy {
             return this.sliceNestedGroupedSeries(data, metricInfo, dateRange);
         }
 
-        const rawData = this.getNestedValue(data, metricInfo.name);
+        const rawData = getNestedValue(data, metricInfo.name);
 
         if (!rawData || !rawData.dates || !rawData.values) {
             return { dates: [], values: [] };
@@ -72,12 +107,45 @@ export class GroupedSeriesSlicingStrategy implements SlicingStrategy {
         let values = rawData.values;
 
         if (dateRange) {
-            const filteredIndices = DateFilterUtil.getDateIndicesInRange(dates, dateRange);
-            dates = filteredIndices.map(i => dates[i]);
-            values = values.map((series: any) => ({
-                label: series.label,
-                values: filteredIndices.map(i => series.values[i])
-            }));
+            let byRange = dateIndicesCache.get(dates);
+            if (!byRange) {
+                byRange = new Map();
+                dateIndicesCache.set(dates, byRange);
+            }
+
+            // First slice for a given range scans the dates once; repeats
+            // against the same payload reuse the kept-index list and only
+            // pay for the gather
+            let keptIndices = byRange.get(dateRange);
+            if (!keptIndices) {
+                const inRange = DateFilterUtil.compileDatePredicate(dateRange);
+                keptIndices = [];
+                for (let i = 0; i < dates.length; i++) {
+                    const date = dates[i];
+                    if (date && inRange(date)) {
+                        keptIndices.push(i);
+                    }
+                }
+                byRange.set(dateRange, keptIndices);
+            }
+
+            // A range that keeps every row (e.g. a full-year filter over a
+            // year of data) needs no rebuild — return the original arrays
+            if (keptIndices.length < dates.length) {
+                const kept = keptIndices;
+                const keptDates = new Array(kept.length);
+                for (let j = 0; j < kept.length; j++) {
+                    keptDates[j] = dates[kept[j]];
+                }
+                dates = keptDates;
+                values = values.map((series: any) => {
+                    const seriesValues = new Array(kept.length);
+                    for (let j = 0; j < kept.length; j++) {
+                        seriesValues[j] = series.values[kept[j]];
+                    }
+                    return { label: series.label, values: seriesValues };
+                });
+            }
         }
 
         return { dates, values };
@@ -88,7 +156,7 @@ export class GroupedSeriesSlicingStrategy implements SlicingStrategy {
         const containerPath = pathParts.slice(0, -1).join('.');
         const metricKey = pathParts[pathParts.length - 1];
 
-        const containerData = this.getNestedValue(data, containerPath);
+        const containerData = getNestedValue(data, containerPath);
 
         if (!Array.isArray(containerData)) {
             return { dates: [], values: [] };
@@ -99,15 +167,23 @@ export class GroupedSeriesSlicingStrategy implements SlicingStrategy {
         if (metricKey === 'value' && containerData.length > 0 &&
             containerData[0].date && containerData[0].value !== undefined) {
 
-            // Filter by date range if specified
-            const filteredData = DateFilterUtil.filterByDateRange(containerData, 'date', dateRange);
+            // Filter and project in one pass, as in the time series strategy
+            const inRange = DateFilterUtil.compileDatePredicate(dateRange);
+            const dates: string[] = [];
+            const seriesValues: number[] = [];
+
+            for (const item of containerData as any[]) {
+                if (inRange && !(item.date && inRange(item.date))) continue;
+                dates.push(item.date);
+                seriesValues.push(item.value);
+            }
 
             // Return as time series format
             return {
-                dates: filteredData.map((item: any) => item.date),
+                dates,
                 values: [{
                     label: metricInfo.description,
-                    values: filteredData.map((item: any) => item.value)
+                    values: seriesValues
                 }]
             };
         }
@@ -124,12 +200,6 @@ export class GroupedSeriesSlicingStrategy implements SlicingStrategy {
             }]
         };
     }
-
-    private getNestedValue(obj: any, path: string): any {
-        return path.split('.').reduce((current, key) => {
-            return current && current[key] !== undefined ? current[key] : undefined;
-        }, obj);
-    }
 }
 
 /**
@@ -137,7 +207,7 @@ export class GroupedSeriesSlicingStrategy implements SlicingStrategy {
  */
 export class ScalarSlicingStrategy implements SlicingStrategy {
     slice(data: any, metricInfo: MetricInfo): ChartData {
-        const value = this.getNestedValue(data, metricInfo.name);
+        const value = getNestedValue(data, metricInfo.name);
 
         return {
             dates: ['Total'],
@@ -147,12 +217,6 @@ export class ScalarSlicingStrategy implements SlicingStrategy {
             }]
         };
     }
-
-    private getNestedValue(obj: any, path: string): any {
-        return path.split('.').reduce((current, key) => {
-            return current && current[key] !== undefined ? current[key] : undefined;
-        }, obj);
-    }
 }
 
 /**
@@ -160,7 +224,7 @@ export class ScalarSlicingStrategy implements SlicingStrategy {
  */
 export class DynamicKeyObjectSlicingStrategy implements SlicingStrategy {
     slice(data: any, metricInfo: MetricInfo): ChartData {
-        const rawData = this.getNestedValue(data, metricInfo.name);
+        const rawData = getNestedValue(data, metricInfo.name);
 
         if (!rawData || typeof rawData !== 'object') {
             return { dates: [], values: [] };
@@ -215,12 +279,6 @@ export class DynamicKeyObjectSlicingStrategy implements SlicingStrategy {
             }]
         };
     }
-
-    private getNestedValue(obj: any, path: string): any {
-        return path.split('.').reduce((current, key) => {
-            return current && current[key] !== undefined ? current[key] : undefined;
-        }, obj);
-    }
 }
 
 /**
@@ -228,7 +286,7 @@ export class DynamicKeyObjectSlicingStrategy implements SlicingStrategy {
  */
 export class EmbeddedMetricsSlicingStrategy implements SlicingStrategy {
     slice(data: any, metricInfo: MetricInfo): ChartData {
-        const rawData = this.getNestedValue(data, metricInfo.name);
+        const rawData = getNestedValue(data, metricInfo.name);
 
         if (!Array.isArray(rawData) || rawData.length === 0) {
             return { dates: [], values: [] };
@@ -267,10 +325,22 @@ export class EmbeddedMetricsSlicingStrategy implements SlicingStrategy {
             return { dates: [], values: [] };
         }
 
-        // Create series for each numeric metric
+        // Create series for each numeric metric. One pass over the rows
+        // fills every column, instead of re-traversing the array of objects
+        // once per key
+        const cols: Record<string, number[]> = {};
+        for (const key of numericKeys) {
+            cols[key] = [];
+        }
+        for (const item of rawData) {
+            for (const key of numericKeys) {
+                cols[key].push((item as any)[key] || 0);
+            }
+        }
+
         const values = numericKeys.map(key => ({
             label: key,
-            values: rawData.map(item => (item as any)[key] || 0)
+            values: cols[key]
         }));
 
         return {
@@ -278,12 +348,6 @@ export class EmbeddedMetricsSlicingStrategy implements SlicingStrategy {
             values: values
         };
     }
-
-    private getNestedValue(obj: any, path: string): any {
-        return path.split('.').reduce((current, key) => {
-            return current && current[key] !== undefined ? current[key] : undefined;
-        }, obj);
-    }
 }
 
 /**
@@ -291,7 +355,7 @@ export class EmbeddedMetricsSlicingStrategy implements SlicingStrategy {
  */
 export class ArraySlicingStrategy implements SlicingStrategy {
     slice(data: any, metricInfo: MetricInfo): ChartData {
-        const rawData = this.getNestedValue(data, metricInfo.name);
+        const rawData = getNestedValue(data, metricInfo.name);
 
         if (!Array.isArray(rawData) || rawData.length === 0) {
             return { dates: [], values: [] };
@@ -308,12 +372,6 @@ export class ArraySlicingStrategy implements SlicingStrategy {
             }]
         };
     }
-
-    private getNestedValue(obj: any, path: string): any {
-        return path.split('.').reduce((current, key) => {
-            return current && current[key] !== undefined ? current[key] : undefined;
-        }, obj);
-    }
 }
 
 /**
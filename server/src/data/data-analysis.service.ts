@@ -1,4 +1,5 @@
 import { Injectable } from '@nestjs/common';
+import { CHART_TYPES } from '../dto/chat.dto';
 
 /**
  * Interface for data analysis results
@@ -16,6 +17,9 @@ export interface ChartSuggestion {
     bestForMetrics: string[];
 }
 
+// Construction sites below all list these properties in declaration order
+// (absent optionals written as undefined) so every MetricInfo shares one
+// object shape and the scan loops over metric lists stay monomorphic
 export interface MetricInfo {
     name: string;
     type: 'scalar' | 'timeSeries' | 'groupedSeries' | 'array' | 'dynamicKeyObject' | 'embeddedMetrics';
@@ -32,6 +36,53 @@ export interface MetricInfo {
 
 
 
+/**
+ * Aggregates accumulated during the extraction walk so generateDataContext
+ * does not need to re-scan the metric list or re-walk the raw data
+ */
+interface WalkStats {
+    timeSeriesCount: number;
+    groupedCount: number;
+    scalarCount: number;
+    embeddedCount: number;
+    detectedYear: string | null;
+}
+
+const YEAR_PREFIX_RE = /^(\d{4})-/;
+
+// Payloads repeat the same leaf names across channels/accounts, so value-type
+// detection and description formatting hit a small set of distinct keys; both
+// are pure string functions, so memoize them at module level
+const VALUE_TYPE_CACHE_MAX = 4096;
+const valueTypeCache = new Map<string, 'currency' | 'percentage' | 'count' | 'generic'>();
+
+const DESCRIPTION_CACHE_MAX = 4096;
+const descriptionCache = new Map<string, string>();
+
+// Shared recommendation lists: the walk can emit thousands of metrics and
+// each previously allocated its own small array for the same few contents.
+// Frozen so a consumer cannot mutate one metric's recommendations for all
+const RECS_BAR = Object.freeze(['bar']) as string[];
+const RECS_BAR_STACKED = Object.freeze(['bar', 'stacked-bar']) as string[];
+const RECS_LINE_BAR = Object.freeze(['line', 'bar']) as string[];
+const RECS_LINE_BAR_STACKED = Object.freeze(['line', 'bar', 'stacked-bar']) as string[];
+
+// Shared comparator so each analyzeData call does not allocate a closure
+const byConfidenceDesc = (a: ChartSuggestion, b: ChartSuggestion) => b.confidence - a.confidence;
+
+const CAMEL_SPLIT_RE = /([A-Z])/g;
+
+// Token-set membership for value-type detection: split the key on camelCase
+// and separator boundaries once, then classify with O(1) Set lookups instead
+// of a substring scan per keyword
+const VALUE_TOKEN_SPLIT_RE = /[\s_.\-]+|(?=[A-Z])/;
+
+// Dynamic-key objects (account-indexed maps) use long alphanumeric IDs as keys
+const ID_KEY_RE = /^[a-zA-Z0-9]+$/;
+const CURRENCY_TOKENS = new Set(['sales', 'revenue', 'income', 'profit', 'cash', 'expenses', 'cost', 'balance', 'amount']);
+const PERCENTAGE_TOKENS = new Set(['percentage', 'rate', 'ratio']);
+const COUNT_TOKENS = new Set(['orders', 'customers', 'count', 'users']);
+
 /**
  * Service for analyzing data structure and providing intelligent chart recommendations
  */
@@ -42,9 +93,16 @@ export class DataAnalysisService {
      * Analyze the loaded data and provide context for chart generation
      */
     analyzeData(data: any): DataAnalysis {
-        const metrics = this.extractMetricsRecursively(data);
+        const stats: WalkStats = {
+            timeSeriesCount: 0,
+            groupedCount: 0,
+            scalarCount: 0,
+            embeddedCount: 0,
+            detectedYear: null
+        };
+        const metrics = this.extractMetrics(data, stats);
         const suggestions = this.generateChartSuggestions(metrics);
-        const context = this.generateDataContext(metrics, data);
+        const context = this.generateDataContext(metrics, stats);
 
         return {
             availableMetrics: metrics,
@@ -54,47 +112,118 @@ export class DataAnalysisService {
     }
 
     /**
-     * Recursively extract and categorize all metrics from the data
+     * Extract and categorize all metrics from the data. The walk uses an
+     * explicit frame stack instead of recursion so deep payloads cost a
+     * stack push per nested object rather than a call frame, while metrics
+     * are still emitted in the same depth-first order as before
      */
-    private extractMetricsRecursively(data: any, keyPath: string[] = [], depth: number = 0): MetricInfo[] {
+    private extractMetrics(data: any, stats?: WalkStats): MetricInfo[] {
         const metrics: MetricInfo[] = [];
         const maxDepth = 10;
 
-        if (depth > maxDepth || !data || typeof data !== 'object') {
+        if (!data || typeof data !== 'object') {
             return metrics;
         }
 
-        for (const [key, value] of Object.entries(data)) {
-            const currentPath = keyPath.length > 0 ? `${keyPath.join('.')}.${key}` : key;
-            const fullPath = [...keyPath, key];
+        interface WalkFrame {
+            entries: [string, any][];
+            index: number;
+            parentPath: string;
+            depth: number;
+        }
+
+        const stack: WalkFrame[] = [{ entries: Object.entries(data), index: 0, parentPath: '', depth: 0 }];
+
+        while (stack.length > 0) {
+            const frame = stack[stack.length - 1];
+            if (frame.index >= frame.entries.length) {
+                stack.pop();
+                continue;
+            }
+            const [key, value] = frame.entries[frame.index++];
+            const { parentPath, depth } = frame;
+            // Dotted path built incrementally from the parent's — no array
+            // copy and join per node
+            const currentPath = parentPath ? `${parentPath}.${key}` : key;
+
+            // Classify the node once; the branches below reuse these instead
+            // of each re-running typeof/Array.isArray on the same value
+            const isObjectLike = value !== null && typeof value === 'object';
+            const isArray = isObjectLike && Array.isArray(value);
+
+            // Leaves are the majority of nodes: a number becomes a scalar
+            // metric and everything else primitive yields nothing, so skip
+            // the array/dynamic-key/recursion dispatch entirely
+            if (!isObjectLike) {
+                if (typeof value === 'number') {
+                    const scalarMetric = this.analyzeMetric(key, value, currentPath);
+                    if (scalarMetric) {
+                        metrics.push(scalarMetric);
+                        if (stats) this.tallyMetric(stats, scalarMetric);
+                    }
+                }
+                continue;
+            }
 
             // Analyze current level metric
             const metric = this.analyzeMetric(key, value, currentPath);
             if (metric) {
                 metrics.push(metric);
+                if (stats) {
+                    this.tallyMetric(stats, metric);
+                    // Grab the data year from the first dated structure seen,
+                    // replacing the separate date-detection walk
+                    if (stats.detectedYear === null && metric.hasTimeData) {
+                        const dateStr = isArray ? value[0]?.date : (value as any)?.dates?.[0];
+                        const yearMatch = String(dateStr ?? '').match(YEAR_PREFIX_RE);
+                        if (yearMatch) {
+                            stats.detectedYear = yearMatch[1];
+                        }
+                    }
+                }
             }
 
             // Handle arrays of objects with embedded metrics
-            if (Array.isArray(value) && value.length > 0 && typeof value[0] === 'object') {
+            if (isArray && value.length > 0 && typeof value[0] === 'object') {
                 const embeddedMetrics = this.extractFromObjectArray(value, currentPath);
                 metrics.push(...embeddedMetrics);
+                if (stats) embeddedMetrics.forEach(m => this.tallyMetric(stats, m));
             }
 
-            // Handle dynamic key objects (cashDetails, creditCardDetails)
-            if (this.isDynamicKeyObject(value)) {
-                const dynamicMetrics = this.extractFromDynamicKeyObject(key, value, currentPath);
-                metrics.push(...dynamicMetrics);
-            }
+            if (isObjectLike && !isArray) {
+                // Classified once here; shouldRecurseInto reuses the answer
+                // instead of re-running the detection on the same object
+                const isDynamic = this.isDynamicKeyObject(value);
+
+                // Handle dynamic key objects (cashDetails, creditCardDetails)
+                if (isDynamic) {
+                    const dynamicMetrics = this.extractFromDynamicKeyObject(key, value, currentPath);
+                    metrics.push(...dynamicMetrics);
+                    if (stats) dynamicMetrics.forEach(m => this.tallyMetric(stats, m));
+                }
 
-            // Recurse into objects that aren't already handled
-            if (this.shouldRecurseInto(value, fullPath)) {
-                metrics.push(...this.extractMetricsRecursively(value, fullPath, depth + 1));
+                // Descend into objects that aren't already handled; the depth
+                // cap is enforced at the push site so doomed frames are never
+                // created
+                if (depth + 1 <= maxDepth && this.shouldRecurseInto(value, depth, isDynamic)) {
+                    stack.push({ entries: Object.entries(value), index: 0, parentPath: currentPath, depth: depth + 1 });
+                }
             }
         }
 
         return metrics;
     }
 
+    /**
+     * Bump the context counters for a metric as the walk emits it
+     */
+    private tallyMetric(stats: WalkStats, metric: MetricInfo): void {
+        if (metric.hasTimeData) stats.timeSeriesCount++;
+        if (metric.hasGrouping) stats.groupedCount++;
+        if (metric.type === 'scalar') stats.scalarCount++;
+        if (metric.type === 'embeddedMetrics' || metric.type === 'dynamicKeyObject') stats.embeddedCount++;
+    }
+
     /**
      * Extract metrics from arrays of objects with embedded metrics
      */
@@ -111,61 +240,81 @@ export class DataAnalysisService {
             typeof firstItem[key] === 'number' && key !== 'date'
         );
 
-        // Create a container metric for the array
-        if (numericKeys.length > 0) {
-            const groupingDimensions = array.map((item, index) => {
-                const label = item.connector || item.label || item.name;
-
-                // If we still don't have a good label, try to extract from other fields
-                if (!label || label.toLowerCase().includes('unknown')) {
-                    const fallback = item.channel || item.type || item.id ||
-                        Object.keys(item).find(key =>
-                            key !== 'values' &&
-                            key !== 'date' &&
-                            typeof item[key] === 'string' &&
-                            item[key].length > 0 &&
-                            !item[key].toLowerCase().includes('unknown') &&
-                            !item[key].toLowerCase().includes('undefined') &&
-                            !item[key].toLowerCase().includes('null')
-                        );
-                    return fallback ? item[fallback] : `Category ${index + 1}`;
+        // Nothing numeric to chart: skip the label/sample collection entirely
+        // (common for metadata-only sections)
+        if (numericKeys.length === 0) {
+            return metrics;
+        }
+
+        // One pass collects both the grouping labels and the first three
+        // sample values per numeric key, instead of re-slicing the array
+        // for every key below
+        const groupingDimensions: any[] = [];
+        const samples: Record<string, any[]> = {};
+        for (const nk of numericKeys) {
+            samples[nk] = [];
+        }
+
+        array.forEach((item, index) => {
+            if (index < 3) {
+                for (const nk of numericKeys) {
+                    samples[nk].push((item as any)[nk]);
                 }
+            }
 
-                return label;
-            });
+            const label = item.connector || item.label || item.name;
+
+            // If we still don't have a good label, try to extract from other fields
+            if (!label || label.toLowerCase().includes('unknown')) {
+                const fallback = item.channel || item.type || item.id ||
+                    Object.keys(item).find(key =>
+                        key !== 'values' &&
+                        key !== 'date' &&
+                        typeof item[key] === 'string' &&
+                        item[key].length > 0 &&
+                        !item[key].toLowerCase().includes('unknown') &&
+                        !item[key].toLowerCase().includes('undefined') &&
+                        !item[key].toLowerCase().includes('null')
+                    );
+                groupingDimensions.push(fallback ? item[fallback] : `Category ${index + 1}`);
+                return;
+            }
+
+            groupingDimensions.push(label);
+        });
+
+        metrics.push({
+            name: basePath,
+            type: 'embeddedMetrics',
+            description: `${this.generateMetricDescription(basePath, 'embeddedMetrics')} containing ${numericKeys.length} metrics`,
+            hasTimeData: false,
+            hasGrouping: true,
+            groupingDimensions: groupingDimensions,
+            sampleValues: numericKeys.map(key => (firstItem as any)[key]),
+            valueType: 'generic',
+            chartRecommendations: RECS_BAR_STACKED,
+            keyPath: basePath,
+            embeddedMetrics: numericKeys
+        });
+
+        // Create individual metrics for each numeric key
+        for (const key of numericKeys) {
+            const metricName = `${basePath}.${key}`;
+            const valueType = this.detectValueType(key, firstItem[key]);
 
             metrics.push({
-                name: basePath,
-                type: 'embeddedMetrics',
-                description: `${this.generateMetricDescription(basePath, 'embeddedMetrics')} containing ${numericKeys.length} metrics`,
+                name: metricName,
+                type: 'groupedSeries',
+                description: `${this.generateMetricDescription(key, 'groupedSeries')} from ${basePath}`,
                 hasTimeData: false,
                 hasGrouping: true,
                 groupingDimensions: groupingDimensions,
-                valueType: 'generic',
-                chartRecommendations: ['bar', 'stacked-bar'],
-                keyPath: basePath,
-                embeddedMetrics: numericKeys,
-                sampleValues: numericKeys.map(key => (firstItem as any)[key])
+                sampleValues: samples[key],
+                valueType: valueType,
+                chartRecommendations: RECS_BAR_STACKED,
+                keyPath: metricName,
+                embeddedMetrics: undefined
             });
-
-            // Create individual metrics for each numeric key
-            for (const key of numericKeys) {
-                const metricName = `${basePath}.${key}`;
-                const valueType = this.detectValueType(key, firstItem[key]);
-
-                metrics.push({
-                    name: metricName,
-                    type: 'groupedSeries',
-                    description: `${this.generateMetricDescription(key, 'groupedSeries')} from ${basePath}`,
-                    hasTimeData: false,
-                    hasGrouping: true,
-                    groupingDimensions: groupingDimensions,
-                    valueType: valueType,
-                    chartRecommendations: ['bar', 'stacked-bar'],
-                    keyPath: metricName,
-                    sampleValues: array.slice(0, 3).map(item => (item as any)[key])
-                });
-            }
         }
 
         return metrics;
@@ -176,106 +325,135 @@ export class DataAnalysisService {
      */
     private extractFromDynamicKeyObject(containerKey: string, obj: any, basePath: string): MetricInfo[] {
         const metrics: MetricInfo[] = [];
-        const entries = Object.entries(obj);
+        const keys = Object.keys(obj);
 
-        if (entries.length === 0) {
+        if (keys.length === 0) {
             return metrics;
         }
 
-        const [firstKey, firstValue] = entries[0];
-
-        if (typeof firstValue === 'object' && firstValue !== null) {
-            const numericKeys = Object.keys(firstValue).filter(key =>
-                typeof (firstValue as any)[key] === 'number'
-            );
-
-            // Create a container metric
-            if (numericKeys.length > 0) {
-                const groupingDimensions = entries.map(([key, value]: [string, any]) =>
-                    value.name || value.officialName || key
-                );
-
-                metrics.push({
-                    name: basePath,
-                    type: 'dynamicKeyObject',
-                    description: `${this.generateMetricDescription(containerKey, 'dynamicKeyObject')} with ${entries.length} accounts`,
-                    hasTimeData: false,
-                    hasGrouping: true,
-                    groupingDimensions: groupingDimensions,
-                    valueType: 'generic',
-                    chartRecommendations: ['bar'],
-                    keyPath: basePath,
-                    embeddedMetrics: numericKeys,
-                    sampleValues: numericKeys.map(key => (firstValue as any)[key])
-                });
+        const firstValue = obj[keys[0]];
 
-                // Create individual metrics for each numeric property
-                for (const key of numericKeys) {
-                    const metricName = `${basePath}.${key}`;
-                    const valueType = this.detectValueType(key, (firstValue as any)[key]);
-
-                    metrics.push({
-                        name: metricName,
-                        type: 'groupedSeries',
-                        description: `${this.generateMetricDescription(key, 'groupedSeries')} across ${containerKey}`,
-                        hasTimeData: false,
-                        hasGrouping: true,
-                        groupingDimensions: groupingDimensions,
-                        valueType: valueType,
-                        chartRecommendations: ['bar'],
-                        keyPath: metricName,
-                        sampleValues: entries.slice(0, 3).map(([_, value]: [string, any]) => (value as any)[key])
-                    });
+        if (typeof firstValue !== 'object' || firstValue === null) {
+            return metrics;
+        }
+
+        const numericKeys = Object.keys(firstValue).filter(key =>
+            typeof (firstValue as any)[key] === 'number'
+        );
+
+        // Nothing numeric to chart: skip the label/sample collection entirely
+        if (numericKeys.length === 0) {
+            return metrics;
+        }
+
+        // Grouping labels and per-key sample slices in a single pass
+        // over the account map — no Object.entries materialization
+        const groupingDimensions: any[] = [];
+        const samples: Record<string, any[]> = {};
+        for (const nk of numericKeys) {
+            samples[nk] = [];
+        }
+
+        keys.forEach((key, index) => {
+            const value = obj[key];
+            groupingDimensions.push(value.name || value.officialName || key);
+            if (index < 3) {
+                for (const nk of numericKeys) {
+                    samples[nk].push(value[nk]);
                 }
             }
+        });
+
+        metrics.push({
+            name: basePath,
+            type: 'dynamicKeyObject',
+            description: `${this.generateMetricDescription(containerKey, 'dynamicKeyObject')} with ${keys.length} accounts`,
+            hasTimeData: false,
+            hasGrouping: true,
+            groupingDimensions: groupingDimensions,
+            sampleValues: numericKeys.map(key => (firstValue as any)[key]),
+            valueType: 'generic',
+            chartRecommendations: RECS_BAR,
+            keyPath: basePath,
+            embeddedMetrics: numericKeys
+        });
+
+        // Create individual metrics for each numeric property
+        for (const key of numericKeys) {
+            const metricName = `${basePath}.${key}`;
+            const valueType = this.detectValueType(key, (firstValue as any)[key]);
+
+            metrics.push({
+                name: metricName,
+                type: 'groupedSeries',
+                description: `${this.generateMetricDescription(key, 'groupedSeries')} across ${containerKey}`,
+                hasTimeData: false,
+                hasGrouping: true,
+                groupingDimensions: groupingDimensions,
+                sampleValues: samples[key],
+                valueType: valueType,
+                chartRecommendations: RECS_BAR,
+                keyPath: metricName,
+                embeddedMetrics: undefined
+            });
         }
 
         return metrics;
     }
 
     /**
-     * Check if an object has dynamic keys (like account IDs)
+     * Check if an object has dynamic keys (like account IDs). Most objects
+     * are not dynamic-key, so the checks run cheapest-first over the keys
+     * directly and bail on the first mismatch instead of materializing
+     * entries and running two full every() passes
      */
     private isDynamicKeyObject(value: any): boolean {
         if (!value || typeof value !== 'object' || Array.isArray(value)) {
             return false;
         }
 
-        const entries = Object.entries(value);
-        if (entries.length === 0) return false;
+        const keys = Object.keys(value);
+        if (keys.length === 0) return false;
 
-        // Check if keys look like IDs (long alphanumeric strings) or UUIDs
-        const hasIdLikeKeys = entries.every(([key]) =>
-            key.length > 20 && /^[a-zA-Z0-9]+$/.test(key)
-        );
+        // An ordinary short key disproves "dynamic key" immediately
+        const firstKey = keys[0];
+        if (firstKey.length <= 20 || !ID_KEY_RE.test(firstKey)) {
+            return false;
+        }
 
-        // Check if all values have similar structure
-        const firstValue = entries[0][1];
+        const firstValue = value[firstKey];
         if (typeof firstValue !== 'object' || firstValue === null) {
             return false;
         }
 
-        const firstKeys = Object.keys(firstValue);
-        const allSimilarStructure = entries.every(([_, val]) =>
-            typeof val === 'object' && val !== null &&
-            Object.keys(val).length === firstKeys.length
-        );
-
-        const result = hasIdLikeKeys && allSimilarStructure;
+        // Single pass: every key must look like an ID and every value must
+        // share the first value's structure
+        const firstKeyCount = Object.keys(firstValue).length;
+        for (const key of keys) {
+            if (key.length <= 20 || !ID_KEY_RE.test(key)) {
+                return false;
+            }
+            const val = value[key];
+            if (typeof val !== 'object' || val === null || Object.keys(val).length !== firstKeyCount) {
+                return false;
+            }
+        }
 
-        return result;
+        return true;
     }
 
     /**
-     * Check if we should recurse into this object
+     * Check if we should recurse into this object. The caller has already
+     * classified the node, so the dynamic-key answer is passed in rather
+     * than recomputed
      */
-    private shouldRecurseInto(value: any, path: string[]): boolean {
+    private shouldRecurseInto(value: any, depth: number, isDynamicKeyObject: boolean): boolean {
         if (!value || typeof value !== 'object' || Array.isArray(value)) {
             return false;
         }
 
         // Don't recurse into known patterns we've already handled
-        if (this.isDynamicKeyObject(value)) {
+        if (isDynamicKeyObject) {
             return false;
         }
 
@@ -284,8 +462,8 @@ export class DataAnalysisService {
             return false;
         }
 
-        // Don't recurse too deep
-        if (path.length > 5) {
+        // Don't recurse too deep (a child would sit more than 5 levels down)
+        if (depth + 1 > 5) {
             return false;
         }
 
@@ -308,10 +486,12 @@ export class DataAnalysisService {
                 description: this.generateMetricDescription(key, 'scalar'),
                 hasTimeData: false,
                 hasGrouping: false,
-                valueType: valueType,
-                chartRecommendations: ['bar'],
+                groupingDimensions: undefined,
                 sampleValues: [value],
-                keyPath: fullPath
+                valueType: valueType,
+                chartRecommendations: RECS_BAR,
+                keyPath: fullPath,
+                embeddedMetrics: undefined
             };
         }
 
@@ -345,10 +525,12 @@ export class DataAnalysisService {
                 description: this.generateMetricDescription(key, 'timeSeries'),
                 hasTimeData: true,
                 hasGrouping: false,
-                valueType: this.detectValueType(key, firstItem.value),
-                chartRecommendations: ['line', 'bar'],
+                groupingDimensions: undefined,
                 sampleValues: value.slice(0, 3).map(item => item.value),
-                keyPath: fullPath
+                valueType: this.detectValueType(key, firstItem.value),
+                chartRecommendations: RECS_LINE_BAR,
+                keyPath: fullPath,
+                embeddedMetrics: undefined
             };
         }
 
@@ -363,10 +545,12 @@ export class DataAnalysisService {
             description: this.generateMetricDescription(key, 'array'),
             hasTimeData: false,
             hasGrouping: false,
-            valueType: 'generic',
-            chartRecommendations: ['bar'],
+            groupingDimensions: undefined,
             sampleValues: value.slice(0, 3),
-            keyPath: fullPath
+            valueType: 'generic',
+            chartRecommendations: RECS_BAR,
+            keyPath: fullPath,
+            embeddedMetrics: undefined
         };
     }
 
@@ -386,10 +570,11 @@ export class DataAnalysisService {
                 hasTimeData: true,
                 hasGrouping: true,
                 groupingDimensions,
-                valueType: this.detectValueType(key, value.values[0]?.values?.[0]),
-                chartRecommendations: ['line', 'bar', 'stacked-bar'],
                 sampleValues: value.values[0]?.values?.slice(0, 3),
-                keyPath: fullPath
+                valueType: this.detectValueType(key, value.values[0]?.values?.[0]),
+                chartRecommendations: RECS_LINE_BAR_STACKED,
+                keyPath: fullPath,
+                embeddedMetrics: undefined
             };
         }
 
@@ -401,26 +586,50 @@ export class DataAnalysisService {
      */
     private detectValueType(key: string, sampleValue: any): 'currency' | 'percentage' | 'count' | 'generic' {
         const keyLower = key.toLowerCase();
+        // The sample value only matters for the whole-number check below, so
+        // fold it into the cache key as a boolean
+        const isIntegral = typeof sampleValue === 'number' && sampleValue % 1 === 0;
+        const cacheKey = `${key}|${isIntegral}`;
+        const cached = valueTypeCache.get(cacheKey);
+        if (cached !== undefined) {
+            return cached;
+        }
 
-        // Currency indicators
-        if (keyLower.includes('sales') || keyLower.includes('revenue') || keyLower.includes('income') ||
-            keyLower.includes('profit') || keyLower.includes('cash') || keyLower.includes('expenses') ||
-            keyLower.includes('cost') || keyLower.includes('margin') && !keyLower.includes('percentage') ||
-            keyLower.includes('balance') || keyLower.includes('amount')) {
-            return 'currency';
+        const result = this.computeValueType(key, keyLower, isIntegral);
+        if (valueTypeCache.size >= VALUE_TYPE_CACHE_MAX) {
+            valueTypeCache.clear();
         }
+        valueTypeCache.set(cacheKey, result);
+        return result;
+    }
 
-        // Percentage indicators
-        if (keyLower.includes('percentage') || keyLower.includes('rate') || keyLower.includes('ratio')) {
-            return 'percentage';
+    private computeValueType(key: string, keyLower: string, isIntegral: boolean): 'currency' | 'percentage' | 'count' | 'generic' {
+        // One tokenization pass collects membership flags; the decision below
+        // keeps the original currency > percentage > count precedence
+        let isCurrency = false;
+        let isPercentage = false;
+        let isCount = false;
+        let hasTotal = false;
+        for (const raw of key.split(VALUE_TOKEN_SPLIT_RE)) {
+            if (!raw) continue;
+            const token = raw.toLowerCase();
+            if (CURRENCY_TOKENS.has(token)) isCurrency = true;
+            else if (PERCENTAGE_TOKENS.has(token)) isPercentage = true;
+            else if (COUNT_TOKENS.has(token)) isCount = true;
+            else if (token === 'total') hasTotal = true;
         }
 
-        // Count indicators
-        if (keyLower.includes('orders') || keyLower.includes('customers') || keyLower.includes('count') ||
-            keyLower.includes('users') || keyLower.includes('total') && typeof sampleValue === 'number' && sampleValue % 1 === 0) {
+        // 'margin' stays a substring check: it signals currency only when the
+        // key is not itself a percentage (e.g. grossMarginPercentage)
+        if (isCurrency || (keyLower.includes('margin') && !keyLower.includes('percentage'))) {
+            return 'currency';
+        }
+        if (isPercentage) {
+            return 'percentage';
+        }
+        if (isCount || (hasTotal && isIntegral)) {
             return 'count';
         }
-
         return 'generic';
     }
 
@@ -428,7 +637,22 @@ export class DataAnalysisService {
      * Generate human-readable descriptions for metrics
      */
     private generateMetricDescription(key: string, type: string): string {
-        const keyWords = key.replace(/([A-Z])/g, ' $1').toLowerCase().trim();
+        const cacheKey = `${key}|${type}`;
+        const cached = descriptionCache.get(cacheKey);
+        if (cached !== undefined) {
+            return cached;
+        }
+
+        const description = this.formatMetricDescription(key, type);
+        if (descriptionCache.size >= DESCRIPTION_CACHE_MAX) {
+            descriptionCache.clear();
+        }
+        descriptionCache.set(cacheKey, description);
+        return description;
+    }
+
+    private formatMetricDescription(key: string, type: string): string {
+        const keyWords = key.replace(CAMEL_SPLIT_RE, ' $1').toLowerCase().trim();
 
         switch (type) {
             case 'scalar':
@@ -479,7 +703,7 @@ export class DataAnalysisService {
         const qualityThreshold = 0.4;
         const filteredSuggestions = Array.from(chartCandidates.values())
             .filter(s => s.confidence >= qualityThreshold)
-            .sort((a, b) => b.confidence - a.confidence)
+            .sort(byConfidenceDesc)
             .slice(0, 5); // Limit to top 5 suggestions
 
         return filteredSuggestions;
@@ -490,8 +714,7 @@ export class DataAnalysisService {
      */
     private generateMetricSpecificSuggestions(metric: MetricInfo): ChartSuggestion[] {
         const suggestions: ChartSuggestion[] = [];
-        const chartTypes: Array<'line' | 'bar' | 'stacked-bar' | 'heatmap' | 'waterfall'> =
-            ['line', 'bar', 'stacked-bar', 'heatmap', 'waterfall'];
+        const chartTypes = CHART_TYPES;
 
         for (const chartType of chartTypes) {
             const dataScore = this.scoreMetricDataCompatibility(chartType, metric);
@@ -519,20 +742,45 @@ export class DataAnalysisService {
     private generateCombinationSuggestions(metrics: MetricInfo[]): ChartSuggestion[] {
         const suggestions: ChartSuggestion[] = [];
 
-        const timeSeriesMetrics = metrics.filter(m => m.hasTimeData);
-        const groupedMetrics = metrics.filter(m => m.hasGrouping);
-        const currencyMetrics = metrics.filter(m => m.valueType === 'currency');
-        const changeMetrics = metrics.filter(m =>
-            m.name.toLowerCase().includes('change') ||
-            m.name.toLowerCase().includes('delta') ||
-            m.name.toLowerCase().includes('diff')
-        );
+        // One pass buckets every metric; the previous version scanned the
+        // full list six times (and lowercased each name three times)
+        let timeSeriesCount = 0;
+        let groupedCount = 0;
+        let currencyCount = 0;
+        const compatibleTimeSeries: MetricInfo[] = [];
+        const groupedCurrencyMetrics: MetricInfo[] = [];
+        const changeMetrics: MetricInfo[] = [];
+        const complexMetrics: MetricInfo[] = [];
+
+        for (const m of metrics) {
+            const dimensionCount = m.groupingDimensions?.length || 0;
+            if (m.hasTimeData) {
+                timeSeriesCount++;
+                if (m.valueType === 'currency' || m.valueType === 'count') {
+                    compatibleTimeSeries.push(m);
+                }
+                if (m.hasGrouping && dimensionCount > 3) {
+                    complexMetrics.push(m);
+                }
+            }
+            if (m.hasGrouping) {
+                groupedCount++;
+                if (m.valueType === 'currency' && dimensionCount <= 8) {
+                    groupedCurrencyMetrics.push(m);
+                }
+            }
+            if (m.valueType === 'currency') {
+                currencyCount++;
+            }
+            const nameLower = m.name.toLowerCase();
+            if (nameLower.includes('change') || nameLower.includes('delta') || nameLower.includes('diff')) {
+                changeMetrics.push(m);
+            }
+        }
 
         // Multi-metric line chart for compatible time series
-        if (timeSeriesMetrics.length >= 2) {
-            const compatibleMetrics = timeSeriesMetrics.filter(m =>
-                m.valueType === 'currency' || m.valueType === 'count'
-            ).slice(0, 4); // Limit to avoid clutter
+        if (timeSeriesCount >= 2) {
+            const compatibleMetrics = compatibleTimeSeries.slice(0, 4); // Limit to avoid clutter
 
             if (compatibleMetrics.length >= 2) {
                 let confidence = 0.75;
@@ -553,11 +801,8 @@ export class DataAnalysisService {
         }
 
         // Stacked bar for grouped financial metrics
-        if (groupedMetrics.length >= 2 && currencyMetrics.length >= 2) {
-            const relevantMetrics = metrics.filter(m =>
-                m.hasGrouping && m.valueType === 'currency' &&
-                (m.groupingDimensions?.length || 0) <= 8
-            ).slice(0, 3);
+        if (groupedCount >= 2 && currencyCount >= 2) {
+            const relevantMetrics = groupedCurrencyMetrics.slice(0, 3);
 
             if (relevantMetrics.length >= 2) {
                 suggestions.push({
@@ -580,9 +825,6 @@ export class DataAnalysisService {
         }
 
         // Heatmap for complex multi-dimensional data
-        const complexMetrics = metrics.filter(m =>
-            m.hasGrouping && m.hasTimeData && (m.groupingDimensions?.length || 0) > 3
-        );
         if (complexMetrics.length > 0) {
             suggestions.push({
                 chartType: 'heatmap',
@@ -733,15 +975,18 @@ export class DataAnalysisService {
     /**
      * Generate contextual information about the data for the AI model
      */
-    private generateDataContext(metrics: MetricInfo[], data?: any): string {
-        const timeSeriesCount = metrics.filter(m => m.hasTimeData).length;
-        const groupedCount = metrics.filter(m => m.hasGrouping).length;
-        const scalarCount = metrics.filter(m => m.type === 'scalar').length;
-        const embeddedCount = metrics.filter(m => m.type === 'embeddedMetrics' || m.type === 'dynamicKeyObject').length;
-
-        const currencyMetrics = metrics.filter(m => m.valueType === 'currency');
-        const percentageMetrics = metrics.filter(m => m.valueType === 'percentage');
-        const countMetrics = metrics.filter(m => m.valueType === 'count');
+    private generateDataContext(metrics: MetricInfo[], stats: WalkStats): string {
+        const { timeSeriesCount, groupedCount, scalarCount, embeddedCount } = stats;
+
+        // Single pass over the metric list for the three value-type buckets
+        const currencyNames: string[] = [];
+        const percentageNames: string[] = [];
+        const countNames: string[] = [];
+        for (const m of metrics) {
+            if (m.valueType === 'currency') currencyNames.push(m.name);
+            else if (m.valueType === 'percentage') percentageNames.push(m.name);
+            else if (m.valueType === 'count') countNames.push(m.name);
+        }
 
         let context = `This dataset contains ${metrics.length} metrics. `;
 
@@ -761,54 +1006,21 @@ export class DataAnalysisService {
             context += `There are ${embeddedCount} complex metrics with embedded sub-metrics or account-level breakdowns. `;
         }
 
-        if (currencyMetrics.length > 0) {
-            context += `Currency metrics include: ${currencyMetrics.map(m => m.name).join(', ')}. `;
+        if (currencyNames.length > 0) {
+            context += `Currency metrics include: ${currencyNames.join(', ')}. `;
         }
 
-        if (percentageMetrics.length > 0) {
-            context += `Percentage metrics include: ${percentageMetrics.map(m => m.name).join(', ')}. `;
+        if (percentageNames.length > 0) {
+            context += `Percentage metrics include: ${percentageNames.join(', ')}. `;
         }
 
-        if (countMetrics.length > 0) {
-            context += `Count metrics include: ${countMetrics.map(m => m.name).join(', ')}. `;
+        if (countNames.length > 0) {
+            context += `Count metrics include: ${countNames.join(', ')}. `;
         }
 
-        // Try to detect the year range from actual data
-        if (data) {
-            let detectedYear = null;
-
-            // Look for dates in various common structures
-            const checkForDates = (obj: any, path: string = ''): string | null => {
-                if (Array.isArray(obj)) {
-                    for (const item of obj.slice(0, 3)) {
-                        if (item && typeof item === 'object' && item.date) {
-                            const dateStr = String(item.date);
-                            const yearMatch = dateStr.match(/^(\d{4})-/);
-                            if (yearMatch) return yearMatch[1];
-                        }
-                    }
-                } else if (obj && typeof obj === 'object') {
-                    // Check for dates arrays in grouped data
-                    if (obj.dates && Array.isArray(obj.dates) && obj.dates.length > 0) {
-                        const dateStr = String(obj.dates[0]);
-                        const yearMatch = dateStr.match(/^(\d{4})-/);
-                        if (yearMatch) return yearMatch[1];
-                    }
-
-                    // Recursively check nested objects in data
-                    for (const key of Object.keys(obj).slice(0, 10)) {
-                        const result = checkForDates(obj[key], path + '.' + key);
-                        if (result) return result;
-                    }
-                }
-                return null;
-            };
-
-            detectedYear = checkForDates(data);
-
-            if (detectedYear) {
-                context += `Data appears to be from ${detectedYear}. Use ${detectedYear} for date ranges unless user specifies otherwise. `;
-            }
+        // Year detected during the extraction walk (no second pass over data)
+        if (stats.detectedYear) {
+            context += `Data appears to be from ${stats.detectedYear}. Use ${stats.detectedYear} for date ranges unless user specifies otherwise. `;
         }
 
         return context;
@@ -1,17 +1,49 @@
-import { Injectable } from '@nestjs/common';
+import { HttpException, Injectable } from '@nestjs/common';
 import { DataAnalysisService, MetricInfo } from './data-analysis.service';
 import { IrisApiService } from '../api/iris-api.service';
 import { ChartDataSlicerService, ChartData } from './chart-data-slicer.service';
 import { DateFilterUtil } from '../utils/date-filter.util';
 import { ErrorHandlerService } from '../common/error-handler.service';
 
+// Metric token lists are pure functions of the metric object and analyses are
+// cached for an hour, so tokenizing name/description once per metric and
+// keying weakly on it avoids re-splitting on every lookup
+const metricTokensCache = new WeakMap<object, string[]>();
+
+// Lowercased "name description" text per metric, for synonym matching
+const metricTextCache = new WeakMap<object, string>();
+
+// Exact-match lookup table per analysis: lowercased metric name -> MetricInfo.
+// Keyed weakly on the analysis object so it ages out with the cache entry
+const metricIndexCache = new WeakMap<object, Map<string, MetricInfo>>();
+
+// Joined metric-name listing per analysis for not-found error messages, so
+// repeated misses don't rebuild the list and re-join it each time
+const availableNamesCache = new WeakMap<object, string>();
+
+// Compiled once for tokenize(); splits on whitespace, dashes, underscores, dots
+const TOKEN_SPLIT_RE = /[\s\-_\.]+/;
+
+/**
+ * Cached payload plus its analysis for a single date range
+ */
+interface MetricsCacheEntry {
+    data: any;
+    analysis: any;
+    cachedAt: number;
+}
+
 /**
  * Service for handling metrics data operations with caching
  */
 @Injectable()
 export class MetricsService {
-    private cache: Map<string, any> = new Map();
-    private dataAnalysis: any;
+    private static readonly CACHE_TTL_MS = 60 * 60 * 1000;
+
+    private cache: Map<string, MetricsCacheEntry> = new Map();
+    // In-flight fetch per cache key so concurrent cold misses share one
+    // upstream call instead of stampeding the Iris API
+    private inflight: Map<string, Promise<any>> = new Map();
     
     private readonly SEMANTIC_MAPPINGS: Record<string, string[]> = {
         'revenue': ['sales', 'income', 'earnings', 'turnover'],
@@ -40,33 +72,64 @@ export class MetricsService {
     async load(dateRange?: string) {
         // Create cache key based on date range
         const cacheKey = dateRange || 'default';
+        const cached = this.cache.get(cacheKey);
+
+        if (cached) {
+            if (Date.now() - cached.cachedAt < MetricsService.CACHE_TTL_MS) {
+                return cached.data;
+            }
 
-        if (!this.cache.has(cacheKey)) {
-            try {
-                this.errorHandler.logInfo('data_loading', 'Loading data from Iris Finance API', {
-                    component: 'MetricsService',
-                    metadata: { dateRange }
-                });
-
-                const data = await this.irisApiService.fetchMetrics(dateRange);
-
-                this.cache.set(cacheKey, data);
-                this.dataAnalysis = this.dataAnalysisService.analyzeData(data);
-
-                this.errorHandler.logInfo('data_analysis', `Detected ${this.dataAnalysis.availableMetrics.length} metrics in the dataset`, {
-                    component: 'MetricsService',
-                    metadata: { metricsCount: this.dataAnalysis.availableMetrics.length, dateRange }
-                });
-
-            } catch (error) {
-                this.errorHandler.handleExternalApiError('IrisFinanceAPI', 'fetchMetrics', error, {
-                    operation: 'load',
-                    component: 'MetricsService',
-                    metadata: { dateRange }
-                });
+            // Expired but present: serve the stale copy immediately and
+            // refresh in the background, so no request ever blocks on the
+            // upstream fetch once the key has been loaded at least once
+            if (!this.inflight.has(cacheKey)) {
+                const refresh = this.fetchAndCache(cacheKey, dateRange)
+                    .finally(() => this.inflight.delete(cacheKey));
+                this.inflight.set(cacheKey, refresh);
+                // Failure is already logged in fetchAndCache; the stale copy
+                // keeps serving until a later refresh succeeds
+                refresh.catch(() => undefined);
             }
+            return cached.data;
+        }
+
+        // Coalesce concurrent misses: the first caller fetches, the rest
+        // await the same promise
+        let pending = this.inflight.get(cacheKey);
+        if (!pending) {
+            pending = this.fetchAndCache(cacheKey, dateRange)
+                .finally(() => this.inflight.delete(cacheKey));
+            this.inflight.set(cacheKey, pending);
+        }
+
+        return pending;
+    }
+
+    private async fetchAndCache(cacheKey: string, dateRange?: string) {
+        try {
+            this.errorHandler.logInfo('data_loading', 'Loading data from Iris Finance API', {
+                component: 'MetricsService',
+                metadata: { dateRange }
+            });
+
+            const data = await this.irisApiService.fetchMetrics(dateRange);
+            const analysis = this.dataAnalysisService.analyzeData(data);
+
+            this.cache.set(cacheKey, { data, analysis, cachedAt: Date.now() });
+
+            this.errorHandler.logInfo('data_analysis', `Detected ${analysis.availableMetrics.length} metrics in the dataset`, {
+                component: 'MetricsService',
+                metadata: { metricsCount: analysis.availableMetrics.length, dateRange }
+            });
+
+            return data;
+        } catch (error) {
+            this.errorHandler.handleExternalApiError('IrisFinanceAPI', 'fetchMetrics', error, {
+                operation: 'fetchAndCache',
+                component: 'MetricsService',
+                metadata: { dateRange }
+            });
         }
-        return this.cache.get(cacheKey);
     }
 
     /**
@@ -76,7 +139,8 @@ export class MetricsService {
      */
     async getDataAnalysis(dateRange?: string) {
         await this.load(dateRange);
-        return this.dataAnalysis;
+        const cacheKey = dateRange || 'default';
+        return this.cache.get(cacheKey)?.analysis;
     }
 
     /**
@@ -89,7 +153,10 @@ export class MetricsService {
     async slice(metric: string, dateRange: string, groupBy?: string): Promise<ChartData> {
         try {
             const data = await this.load(dateRange);
-            const analysis = this.dataAnalysis;
+            // Bind the analysis belonging to this date range's cache entry;
+            // the shared instance attribute is clobbered by whichever load
+            // finished last and races under concurrent mixed-range requests
+            const analysis = this.cache.get(dateRange || 'default')?.analysis;
 
             // Validate inputs using centralized error handling
             if (!metric || metric.trim() === '') {
@@ -109,33 +176,49 @@ export class MetricsService {
                 );
             }
 
-            // Find the matching metric with flexible matching
-            let metricInfo = analysis.availableMetrics.find((m: MetricInfo) =>
-                m.name.toLowerCase() === metric.toLowerCase()
-            );
+            // Lowercased once; the index probe and token search both use it
+            const metricLower = metric.toLowerCase();
+
+            if (!analysis) {
+                this.errorHandler.handleDataProcessingError(
+                    'data_slicing',
+                    'metric data',
+                    new Error(`No analysis available for date range "${dateRange}"`)
+                );
+            }
+
+            // Find the matching metric with flexible matching: one Map probe
+            // instead of a linear scan that lowercases every name per request
+            let metricInfo = this.getMetricIndex(analysis!).get(metricLower);
 
             // If exact match not found, try tokenized search
             if (!metricInfo) {
-                const searchResults = this.tokenizeAndSearch(metric, analysis.availableMetrics);
+                const searchResults = this.tokenizeAndSearch(metric, analysis!.availableMetrics);
                 if (searchResults.length > 0) {
                     metricInfo = searchResults[0];
                 }
             }
 
             if (!metricInfo) {
-                const availableMetrics = analysis.availableMetrics.map((m: MetricInfo) => m.name);
+                let availableNames = availableNamesCache.get(analysis!);
+                if (availableNames === undefined) {
+                    availableNames = analysis!.availableMetrics.map((m: MetricInfo) => m.name).join(', ');
+                    availableNamesCache.set(analysis!, availableNames);
+                }
                 this.errorHandler.handleDataProcessingError(
                     'metric_lookup',
                     'metric',
-                    new Error(`Metric "${metric}" not found in dataset. Available metrics: ${availableMetrics.join(', ')}`)
+                    new Error(`Metric "${metric}" not found in dataset. Available metrics: ${availableNames}`)
                 );
             }
 
             // Use the chart data slicer to handle different metric types
             return this.chartDataSlicer.slice(data, metricInfo!, dateRange);
         } catch (error) {
-            // If it's already a handled error, re-throw it
-            if (error instanceof Error && (error.name === 'BadRequestException' || error.name === 'NotFoundException')) {
+            // Errors the ErrorHandlerService already classified carry the
+            // right HTTP status; re-throw on type instead of comparing
+            // class-name strings
+            if (error instanceof HttpException) {
                 throw error;
             }
 
@@ -148,8 +231,24 @@ export class MetricsService {
         }
     }
 
+    private getMetricIndex(analysis: any): Map<string, MetricInfo> {
+        let index = metricIndexCache.get(analysis);
+        if (!index) {
+            index = new Map();
+            for (const m of analysis.availableMetrics as MetricInfo[]) {
+                const nameLower = m.name.toLowerCase();
+                // Keep the first metric per name, matching find() semantics
+                if (!index.has(nameLower)) {
+                    index.set(nameLower, m);
+                }
+            }
+            metricIndexCache.set(analysis, index);
+        }
+        return index;
+    }
+
     private tokenizeAndSearch(prompt: string, availableMetrics: MetricInfo[]): MetricInfo[] {
-        const promptTokens = this.tokenize(prompt.toLowerCase());
+        const promptTokens = this.tokenize(prompt);
         
         return availableMetrics
             .map(metric => ({
@@ -162,48 +261,78 @@ export class MetricsService {
     }
 
     private tokenize(text: string): string[] {
+        // Lowercase the whole string once rather than allocating a lowered
+        // copy of every token in a trailing map pass
         return text
-            .split(/[\s\-_\.]+/)
-            .filter(token => token.length > 2)
-            .map(token => token.toLowerCase());
+            .toLowerCase()
+            .split(TOKEN_SPLIT_RE)
+            .filter(token => token.length > 2);
+    }
+
+    private getMetricTokens(metric: MetricInfo): string[] {
+        let tokens = metricTokensCache.get(metric);
+        if (!tokens) {
+            tokens = [
+                ...this.tokenize(metric.name),
+                ...this.tokenize(metric.description),
+                metric.valueType,
+                metric.type
+            ];
+            metricTokensCache.set(metric, tokens);
+        }
+        return tokens;
     }
 
     private calculateRelevanceScore(promptTokens: string[], metric: MetricInfo): number {
         let score = 0;
-        const metricTokens = [
-            ...this.tokenize(metric.name),
-            ...this.tokenize(metric.description),
-            metric.valueType,
-            metric.type
-        ];
-        
-        promptTokens.forEach(promptToken => {
-            metricTokens.forEach(metricToken => {
+        const metricTokens = this.getMetricTokens(metric);
+
+        // The score saturates at 1.0, so stop scanning token pairs once two
+        // matches have been found — the result is identical either way
+        outer:
+        for (const promptToken of promptTokens) {
+            for (const metricToken of metricTokens) {
                 if (metricToken.includes(promptToken) || promptToken.includes(metricToken)) {
                     score += 0.8;
+                    if (score >= 1.0) {
+                        break outer;
+                    }
                 }
-            });
-        });
-        
-        score += this.calculateSemanticScore(promptTokens, metric);
-        
+            }
+        }
+
+        if (score < 1.0) {
+            score += this.calculateSemanticScore(promptTokens, metric);
+        }
+
         return Math.min(score, 1.0);
     }
 
     private calculateSemanticScore(promptTokens: string[], metric: MetricInfo): number {
         let semanticScore = 0;
-        
-        promptTokens.forEach(promptToken => {
-            const synonyms = this.SEMANTIC_MAPPINGS[promptToken] || [];
-            const metricText = `${metric.name} ${metric.description}`.toLowerCase();
-            
-            synonyms.forEach((synonym: string) => {
+
+        // Built once per metric (cached), not once per prompt token as before
+        let metricText = metricTextCache.get(metric);
+        if (metricText === undefined) {
+            metricText = `${metric.name} ${metric.description}`.toLowerCase();
+            metricTextCache.set(metric, metricText);
+        }
+
+        for (const promptToken of promptTokens) {
+            const synonyms = this.SEMANTIC_MAPPINGS[promptToken];
+            if (!synonyms) continue;
+
+            for (const synonym of synonyms) {
                 if (metricText.includes(synonym)) {
                     semanticScore += 0.4;
+                    // Score is capped at 0.6, reached after two hits
+                    if (semanticScore >= 0.6) {
+                        return 0.6;
+                    }
                 }
-            });
-        });
-        
-        return Math.min(semanticScore, 0.6);
+            }
+        }
+
+        return semanticScore;
     }
 }
\ No newline at end of file
@@ -1,6 +1,14 @@
 import { IsEnum, IsString, IsOptional, Matches, IsNumber, Min, Max, IsBoolean, IsArray } from 'class-validator';
 import { ApiProperty, ApiPropertyOptional } from '@nestjs/swagger';
 
+/**
+ * Canonical list of supported chart types, shared by validation decorators,
+ * Swagger metadata and services instead of repeating the literal array
+ */
+export const CHART_TYPES = ['line', 'bar', 'stacked-bar', 'heatmap', 'waterfall'] as const;
+
+export type ChartType = typeof CHART_TYPES[number];
+
 /**
  * DTO for chat requests
  * Validates that the incoming request has a valid prompt string
@@ -73,9 +81,9 @@ export class DashboardDto {
  * Defines the structure and validation rules for chart configuration
  */
 export class ChartSpecDto {
-    @IsEnum(['line', 'bar', 'stacked-bar', 'heatmap', 'waterfall'])
-    @ApiProperty({ enum: ['line', 'bar', 'stacked-bar', 'heatmap', 'waterfall'] })
-    chartType: 'line' | 'bar' | 'stacked-bar' | 'heatmap' | 'waterfall';
+    @IsEnum(CHART_TYPES)
+    @ApiProperty({ enum: CHART_TYPES })
+    chartType: ChartType;
 
     @IsString()
     @ApiProperty({ description: 'Metric path/name' })
@@ -141,8 +149,8 @@ export interface ReasoningSummary {
 
 // Response DTOs for documentation of responses
 export class ChatResponseDto {
-    @ApiProperty({ enum: ['line', 'bar', 'stacked-bar', 'heatmap', 'waterfall'] })
-    chartType: 'line' | 'bar' | 'stacked-bar' | 'heatmap' | 'waterfall';
+    @ApiProperty({ enum: CHART_TYPES })
+    chartType: ChartType;
 
     @ApiProperty()
     metric: string;
@@ -1,5 +1,10 @@
 import * as dotenv from 'dotenv';
-dotenv.config();
+
+// Production deployments that preload the environment can skip .env file
+// parsing entirely; config() never overrides variables that are already set
+if (process.env.SKIP_DOTENV !== '1') {
+    dotenv.config();
+}
 
 import { NestFactory } from '@nestjs/core';
 import { Module } from '@nestjs/common';
@@ -16,6 +21,7 @@ import { IntentAnalyzerService } from './reasoning/intent-analyzer.service';
 import { ChartRankerService } from './reasoning/chart-ranker.service';
 import { ErrorHandlerService } from './common/error-handler.service';
 import { ChartDataSlicerService } from './data/chart-data-slicer.service';
+import { gzipResponses } from './common/gzip.middleware';
 import { VersioningType } from '@nestjs/common';
 import { SwaggerModule, DocumentBuilder } from '@nestjs/swagger';
 
@@ -42,24 +48,41 @@ async function bootstrap() {
         cors: true
     });
 
+    // Responses here are large, non-cacheable chart payloads; skip Express's
+    // default ETag hash over every JSON body and the X-Powered-By header
+    const express = app.getHttpAdapter().getInstance();
+    express.disable('etag');
+    express.disable('x-powered-by');
+
+    // Gzip large chart/dashboard JSON payloads; small responses pass through
+    app.use(gzipResponses);
+
     // Enable URI-based API versioning: /v1/*
     app.enableVersioning({
         type: VersioningType.URI,
         defaultVersion: '1',
     });
 
-    // Swagger/OpenAPI setup
-    const config = new DocumentBuilder()
-        .setTitle('Iris Chat-to-Chart API')
-        .setDescription('Natural language to chart spec and data API')
-        .setVersion('1.0.0')
-        .build();
-    const document = SwaggerModule.createDocument(app, config);
-    SwaggerModule.setup('docs', app, document);
+    // Swagger/OpenAPI setup — skipped in production unless explicitly
+    // enabled, so the /docs route and its document never exist there
+    const docsEnabled = process.env.NODE_ENV !== 'production' || process.env.ENABLE_API_DOCS === '1';
+    if (docsEnabled) {
+        const config = new DocumentBuilder()
+            .setTitle('Iris Chat-to-Chart API')
+            .setDescription('Natural language to chart spec and data API')
+            .setVersion('1.0.0')
+            .build();
+        // Passing a factory defers document generation until /docs is first
+        // requested (and memoizes it), keeping scanning cost out of boot
+        SwaggerModule.setup('docs', app, () => SwaggerModule.createDocument(app, config));
+    }
 
-    await app.listen(4000);
-    console.log('✅ Server is running on http://localhost:4000');
-    console.log('📘 API Docs available at http://localhost:4000/docs');
+    const port = Number(process.env.PORT) || 4000;
+    await app.listen(port);
+    console.log(`✅ Server is running on http://localhost:${port}`);
+    if (docsEnabled) {
+        console.log(`📘 API Docs available at http://localhost:${port}/docs`);
+    }
 }
 
 bootstrap(); 
\ No newline at end of file
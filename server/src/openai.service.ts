@@ -4,7 +4,17 @@ import { DataAnalysis } from './data/data-analysis.service';
 import { ReasoningSummary } from './dto/chat.dto';
 import { startTrace } from './observability/langfuse';
 
-const openai = new OpenAI();
+// One shared client for the whole process — its keep-alive connection pool
+// is reused across completions — constructed lazily on first use so merely
+// importing this module (before env loading, or in tooling) never builds it
+let openaiClient: OpenAI | null = null;
+
+function getOpenAiClient(): OpenAI {
+    if (!openaiClient) {
+        openaiClient = new OpenAI();
+    }
+    return openaiClient;
+}
 
 /**
  * OpenAI tool schema for chart creation
@@ -40,55 +50,31 @@ const TOOL_SCHEMA = [{
         }
     }
 }];
+Object.freeze(TOOL_SCHEMA);
+Object.freeze(TOOL_SCHEMA[0]);
+
+// Forces the create_chart tool call; shared across requests rather than
+// allocated inline on every completion
+const TOOL_CHOICE = Object.freeze({
+    type: 'function' as const,
+    function: Object.freeze({ name: 'create_chart' })
+});
 
 /**
- * Service for handling OpenAI API interactions
- * Processes natural language prompts and returns structured chart specifications
+ * Default per-chart-type rationales used when the verbose reasoning does not
+ * name one; defined once instead of per getChartTypeRationale call
  */
-@Injectable()
-export class OpenAiService {
-    /**
-     * Send a prompt to GPT and get back a structured chart specification with explicit reasoning
-     * @param prompt - Natural language description of the desired chart
-     * @param dataAnalysis - Analysis of available data for context
-     * @returns Promise<ChartSpecDto> - Structured chart specification
-     */
-    async prompt(prompt: string, dataAnalysis?: DataAnalysis) {
-        // Step 1: Get explicit reasoning from GPT-4
-        const reasoningResponse = await this.generateReasoning(prompt, dataAnalysis);
-
-        // Step 2: Use reasoning to make final decision
-        const chartSpec = await this.makeReasonedDecision(prompt, dataAnalysis, reasoningResponse);
-
-        // Step 3: Generate condensed reasoning summary
-        const reasoningSummary = this.generateReasoningSummary(
-            prompt,
-            chartSpec,
-            reasoningResponse,
-            dataAnalysis
-        );
-
-        return {
-            ...chartSpec,
-            aiReasoning: reasoningResponse,
-            reasoning_summary: reasoningSummary
-        };
-    }
-
-    /**
-     * Generate explicit step-by-step reasoning for chart selection
-     */
-    private async generateReasoning(prompt: string, dataAnalysis?: DataAnalysis) {
-        const trace = startTrace('openai.generateReasoning', {
-            prompt,
-            metrics: dataAnalysis?.availableMetrics?.length
-        });
-        const span = trace?.span({ name: 'openai.chat.completions', metadata: { model: 'gpt-4o' } });
-        let reasoningPrompt = `You are a data visualization expert. Think step-by-step about this visualization request.
-
-USER REQUEST: "${prompt}"
-
-Think through this systematically:
+const CHART_TYPE_RATIONALES: Record<string, string> = {
+    'line': 'optimal for temporal trends',
+    'bar': 'best for categorical comparison',
+    'stacked-bar': 'shows composition breakdown',
+    'heatmap': 'reveals pattern relationships',
+    'waterfall': 'displays sequential changes'
+};
+
+// Static prompt bodies hoisted so each call interpolates the request into
+// prebuilt text instead of re-evaluating the full template
+const REASONING_GUIDELINES = `Think through this systematically:
 
 STEP 1 - ANALYZE USER INTENT:
 - What is the user trying to understand or discover?
@@ -132,40 +118,82 @@ STEP 5 - FINAL DECISION:
 
 Please provide your reasoning for each step clearly and explicitly.`;
 
-        if (dataAnalysis) {
-            reasoningPrompt += `\n\nAVAILABLE DATA:\n${dataAnalysis.dataContext}`;
+const DECISION_GUIDELINES = `Now, create a structured chart specification that implements the decision from your reasoning.
 
-            reasoningPrompt += `\n\nMETRICS:`;
-            dataAnalysis.availableMetrics.slice(0, 10).forEach(metric => {
-                reasoningPrompt += `\n- ${metric.name}: ${metric.description} (${metric.type}, ${metric.valueType})`;
-            });
+CHART TYPE OPTIONS:
+- line: Time series trends
+- bar: Categorical comparisons  
+- stacked-bar: Composition analysis
+- heatmap: Pattern visualization
+- waterfall: Sequential changes
 
-            // Add chart suggestions with evidence-based confidence to help guide reasoning
-            if (dataAnalysis.suggestedChartTypes.length > 0) {
-                reasoningPrompt += `\n\nCHART SUGGESTIONS FROM DATA ANALYSIS:`;
-                dataAnalysis.suggestedChartTypes.forEach(suggestion => {
-                    const confidenceLevel = this.getConfidenceLevelName(suggestion.confidence);
-                    reasoningPrompt += `\n- ${suggestion.chartType}: ${suggestion.reason}`;
-                    reasoningPrompt += `\n  Confidence: ${confidenceLevel} (${suggestion.confidence.toFixed(2)})`;
+Select the chart type, metric, and date range that best implements your reasoning above.
 
+IMPORTANT: When selecting a metric, use the TECHNICAL name (shown in brackets) for the "metric" field in your response, not the business name.`;
 
-                    // Convert technical metric names to business names for better readability
-                    reasoningPrompt += `\n  Best for: ${suggestion.bestForMetrics.join(', ')}`;
-                });
-                reasoningPrompt += `\n\nNote: These suggestions balance data characteristics with user intent. Higher intent alignment indicates better fit for your analytical goals.`;
-            }
+// Rendered AVAILABLE DATA/METRICS/SUGGESTIONS block per analysis object.
+// The analysis is cached upstream for an hour and serves many prompts, so the
+// block is rendered once and reused; WeakMap ties its lifetime to the analysis
+const dataContextCache = new WeakMap<object, string>();
 
-            // Add data quality warnings for reasoning
-            const qualityIssues = this.identifyDataQualityIssues(dataAnalysis);
-            if (qualityIssues.length > 0) {
-                reasoningPrompt += `\n\nDATA QUALITY CONCERNS:`;
-                qualityIssues.forEach(issue => {
-                    reasoningPrompt += `\n- ${issue}`;
-                });
-            }
+// Verbose model-output logging is debug-only: the reasoning blocks are
+// multi-KB per request and drown operational logs in production
+const DEBUG_REASONING = process.env.DEBUG_REASONING === '1';
+
+/**
+ * Service for handling OpenAI API interactions
+ * Processes natural language prompts and returns structured chart specifications
+ */
+@Injectable()
+export class OpenAiService {
+    /**
+     * Send a prompt to GPT and get back a structured chart specification with explicit reasoning
+     * @param prompt - Natural language description of the desired chart
+     * @param dataAnalysis - Analysis of available data for context
+     * @returns Promise<ChartSpecDto> - Structured chart specification
+     */
+    async prompt(prompt: string, dataAnalysis?: DataAnalysis) {
+        // Step 1: Get explicit reasoning from GPT-4
+        const reasoningResponse = await this.generateReasoning(prompt, dataAnalysis);
+
+        // Step 2: Use reasoning to make final decision
+        const chartSpec = await this.makeReasonedDecision(prompt, dataAnalysis, reasoningResponse);
+
+        // Step 3: Generate condensed reasoning summary
+        const reasoningSummary = this.generateReasoningSummary(
+            prompt,
+            chartSpec,
+            reasoningResponse,
+            dataAnalysis
+        );
+
+        return {
+            ...chartSpec,
+            aiReasoning: reasoningResponse,
+            reasoning_summary: reasoningSummary
+        };
+    }
+
+    /**
+     * Generate explicit step-by-step reasoning for chart selection
+     */
+    private async generateReasoning(prompt: string, dataAnalysis?: DataAnalysis) {
+        const trace = startTrace('openai.generateReasoning', {
+            prompt,
+            metrics: dataAnalysis?.availableMetrics?.length
+        });
+        const span = trace?.span({ name: 'openai.chat.completions', metadata: { model: 'gpt-4o' } });
+        let reasoningPrompt = `You are a data visualization expert. Think step-by-step about this visualization request.
+
+USER REQUEST: "${prompt}"
+
+${REASONING_GUIDELINES}`;
+
+        if (dataAnalysis) {
+            reasoningPrompt += this.renderDataContext(dataAnalysis);
         }
 
-        const reasoningResponse = await openai.chat.completions.create({
+        const reasoningResponse = await getOpenAiClient().chat.completions.create({
             model: 'gpt-4o',
             temperature: 0.3, // Slightly higher for reasoning creativity
             messages: [{
@@ -175,9 +203,11 @@ Please provide your reasoning for each step clearly and explicitly.`;
         });
 
         const reasoning = reasoningResponse.choices[0].message.content;
-        console.log('\n=== GPT-4 RUNTIME REASONING PROCESS ===');
-        console.log(reasoning);
-        console.log('=== END REASONING ===\n');
+        if (DEBUG_REASONING) {
+            console.log('\n=== GPT-4 RUNTIME REASONING PROCESS ===');
+            console.log(reasoning);
+            console.log('=== END REASONING ===\n');
+        }
 
         try {
             (span as any)?.end({ output: reasoning });
@@ -186,6 +216,55 @@ Please provide your reasoning for each step clearly and explicitly.`;
         return reasoning;
     }
 
+    /**
+     * Render the analysis-dependent section of the reasoning prompt. Cached
+     * per analysis object — only the user-specific header changes between
+     * prompts against the same dataset
+     */
+    private renderDataContext(dataAnalysis: DataAnalysis): string {
+        const cached = dataContextCache.get(dataAnalysis);
+        if (cached !== undefined) {
+            return cached;
+        }
+
+        const parts: string[] = [];
+
+        parts.push(`\n\nAVAILABLE DATA:\n${dataAnalysis.dataContext}`);
+
+        parts.push(`\n\nMETRICS:`);
+        dataAnalysis.availableMetrics.slice(0, 10).forEach(metric => {
+            parts.push(`\n- ${metric.name}: ${metric.description} (${metric.type}, ${metric.valueType})`);
+        });
+
+        // Add chart suggestions with evidence-based confidence to help guide reasoning
+        if (dataAnalysis.suggestedChartTypes.length > 0) {
+            parts.push(`\n\nCHART SUGGESTIONS FROM DATA ANALYSIS:`);
+            dataAnalysis.suggestedChartTypes.forEach(suggestion => {
+                const confidenceLevel = this.getConfidenceLevelName(suggestion.confidence);
+                parts.push(`\n- ${suggestion.chartType}: ${suggestion.reason}`);
+                parts.push(`\n  Confidence: ${confidenceLevel} (${suggestion.confidence.toFixed(2)})`);
+
+
+                // Convert technical metric names to business names for better readability
+                parts.push(`\n  Best for: ${suggestion.bestForMetrics.join(', ')}`);
+            });
+            parts.push(`\n\nNote: These suggestions balance data characteristics with user intent. Higher intent alignment indicates better fit for your analytical goals.`);
+        }
+
+        // Add data quality warnings for reasoning
+        const qualityIssues = this.identifyDataQualityIssues(dataAnalysis);
+        if (qualityIssues.length > 0) {
+            parts.push(`\n\nDATA QUALITY CONCERNS:`);
+            qualityIssues.forEach(issue => {
+                parts.push(`\n- ${issue}`);
+            });
+        }
+
+        const context = parts.join('');
+        dataContextCache.set(dataAnalysis, context);
+        return context;
+    }
+
     /**
      * Make final decision based on reasoning
      */
@@ -199,27 +278,18 @@ ORIGINAL REQUEST: "${prompt}"
 MY REASONING:
 ${reasoning}
 
-Now, create a structured chart specification that implements the decision from your reasoning.
-
-CHART TYPE OPTIONS:
-- line: Time series trends
-- bar: Categorical comparisons  
-- stacked-bar: Composition analysis
-- heatmap: Pattern visualization
-- waterfall: Sequential changes
-
-Select the chart type, metric, and date range that best implements your reasoning above.
-
-IMPORTANT: When selecting a metric, use the TECHNICAL name (shown in brackets) for the "metric" field in your response, not the business name.`;
+${DECISION_GUIDELINES}`;
 
         if (dataAnalysis) {
-            decisionPrompt += `\n\nAVAILABLE METRICS:`;
-            dataAnalysis.availableMetrics.forEach(metric => {
-                decisionPrompt += `\n- ${metric.name}: ${metric.description}`;
-            });
+            // Joined in one pass; += per metric rebuilt the growing prompt
+            // string for every entry
+            const metricLines = dataAnalysis.availableMetrics.map(metric =>
+                `\n- ${metric.name}: ${metric.description}`
+            );
+            decisionPrompt += `\n\nAVAILABLE METRICS:${metricLines.join('')}`;
         }
 
-        const response = await openai.chat.completions.create({
+        const response = await getOpenAiClient().chat.completions.create({
             model: 'gpt-4o',
             temperature: 0,
             messages: [{
@@ -227,14 +297,16 @@ IMPORTANT: When selecting a metric, use the TECHNICAL name (shown in brackets) f
                 content: decisionPrompt
             }],
             tools: TOOL_SCHEMA,
-            tool_choice: { type: 'function', function: { name: 'create_chart' } }
+            tool_choice: TOOL_CHOICE
         });
 
         // Parse the tool call arguments into a chart spec object
         const toolCall = response.choices[0].message.tool_calls?.[0];
         if (toolCall?.function?.arguments) {
             const chartSpec = JSON.parse(toolCall.function.arguments);
-            console.log('Chart decision based on reasoning:', chartSpec);
+            if (DEBUG_REASONING) {
+                console.log('Chart decision based on reasoning:', chartSpec);
+            }
             try {
                 (span as any)?.end({ output: chartSpec });
                 (trace as any)?.end({ output: { chartSpec } });
@@ -481,15 +553,7 @@ IMPORTANT: When selecting a metric, use the TECHNICAL name (shown in brackets) f
         }
 
         // Default rationales by chart type
-        const rationales: Record<string, string> = {
-            'line': 'optimal for temporal trends',
-            'bar': 'best for categorical comparison',
-            'stacked-bar': 'shows composition breakdown',
-            'heatmap': 'reveals pattern relationships',
-            'waterfall': 'displays sequential changes'
-        };
-
-        return rationales[chartType] || 'matched to data characteristics';
+        return CHART_TYPE_RATIONALES[chartType] || 'matched to data characteristics';
     }
 
     /**
@@ -1,6 +1,7 @@
 import { Injectable } from '@nestjs/common';
 import { DataAnalysis } from '../data/data-analysis.service';
 import { IntentAnalysis } from './intent-analyzer.service';
+import { CHART_TYPES } from '../dto/chat.dto';
 
 /**
  * Interface for chart ranking results
@@ -50,13 +51,10 @@ export class ChartRankerService {
         k: number = 5,
         intentAnalysis?: IntentAnalysis
     ): TopKChartsAnalysis {
-        const availableCharts: ('line' | 'bar' | 'stacked-bar' | 'heatmap' | 'waterfall')[] =
-            ['line', 'bar', 'stacked-bar', 'heatmap', 'waterfall'];
-
         const rankings: ChartRanking[] = [];
 
         // Score each chart type
-        for (const chartType of availableCharts) {
+        for (const chartType of CHART_TYPES) {
             const ranking = this.scoreChartType(chartType, prompt, dataAnalysis, intentAnalysis);
             rankings.push(ranking);
         }
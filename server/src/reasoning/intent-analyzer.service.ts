@@ -34,6 +34,63 @@ export interface ComparisonSignal {
     strength: number;
 }
 
+/**
+ * Intent patterns with semantic understanding; built once at module load
+ * rather than on every performIntentAnalysis call
+ */
+const INTENT_PATTERNS = {
+    temporal_trend: {
+        keywords: ['trend', 'over time', 'growth', 'decline', 'change', 'progression', 'evolution', 'trajectory', 'movement', 'pattern'],
+        semanticSignals: ['month', 'year', 'quarter', 'week', 'daily', 'annual', 'seasonal', 'historical'],
+        weight: 1.0
+    },
+    categorical_comparison: {
+        keywords: ['compare', 'vs', 'versus', 'against', 'between', 'difference', 'contrast', 'relative to'],
+        semanticSignals: ['better', 'worse', 'higher', 'lower', 'best', 'worst', 'top', 'bottom'],
+        weight: 1.0
+    },
+    compositional_breakdown: {
+        keywords: ['breakdown', 'composition', 'parts', 'segments', 'by', 'split', 'divide', 'portion'],
+        semanticSignals: ['category', 'type', 'group', 'segment', 'component', 'part', 'share'],
+        weight: 1.0
+    },
+    performance_overview: {
+        keywords: ['overview', 'dashboard', 'summary', 'performance', 'status', 'snapshot', 'overall'],
+        semanticSignals: ['key', 'main', 'primary', 'important', 'critical', 'total', 'overall'],
+        weight: 1.2
+    },
+    correlation_analysis: {
+        keywords: ['correlation', 'relationship', 'related', 'connection', 'impact', 'effect', 'influence'],
+        semanticSignals: ['factor', 'driver', 'cause', 'affect', 'dependent', 'independent'],
+        weight: 0.8
+    },
+    anomaly_detection: {
+        keywords: ['anomaly', 'outlier', 'unusual', 'abnormal', 'spike', 'drop', 'unexpected'],
+        semanticSignals: ['strange', 'weird', 'odd', 'different', 'deviation', 'exception'],
+        weight: 0.7
+    },
+    forecasting: {
+        keywords: ['forecast', 'predict', 'future', 'projection', 'estimate', 'anticipate'],
+        semanticSignals: ['next', 'upcoming', 'expected', 'projected', 'planned'],
+        weight: 0.6
+    },
+    drill_down: {
+        keywords: ['detail', 'detailed', 'specific', 'granular', 'deep', 'drill'],
+        semanticSignals: ['exactly', 'precisely', 'specifically', 'particular', 'individual'],
+        weight: 0.9
+    }
+};
+
+/**
+ * Metric names recognised as explicit mentions in prompts
+ */
+const METRIC_PATTERNS = [
+    'sales', 'revenue', 'profit', 'margin', 'cost', 'expenses', 'income',
+    'customers', 'users', 'orders', 'transactions', 'conversion',
+    'growth', 'decline', 'performance', 'efficiency', 'productivity',
+    'cash', 'balance', 'debt', 'assets', 'liabilities'
+];
+
 /**
  * Service responsible for analyzing user intent from natural language prompts
  */
@@ -54,58 +111,23 @@ export class IntentAnalyzerService {
         const negationContext = this.analyzeNegations(promptLower);
         const temporalContext = this.analyzeTemporalPatterns(promptLower);
 
-        // Define intent patterns with semantic understanding
-        const intentPatterns = {
-            temporal_trend: {
-                keywords: ['trend', 'over time', 'growth', 'decline', 'change', 'progression', 'evolution', 'trajectory', 'movement', 'pattern'],
-                semanticSignals: ['month', 'year', 'quarter', 'week', 'daily', 'annual', 'seasonal', 'historical'],
-                weight: 1.0
-            },
-            categorical_comparison: {
-                keywords: ['compare', 'vs', 'versus', 'against', 'between', 'difference', 'contrast', 'relative to'],
-                semanticSignals: ['better', 'worse', 'higher', 'lower', 'best', 'worst', 'top', 'bottom'],
-                weight: 1.0
-            },
-            compositional_breakdown: {
-                keywords: ['breakdown', 'composition', 'parts', 'segments', 'by', 'split', 'divide', 'portion'],
-                semanticSignals: ['category', 'type', 'group', 'segment', 'component', 'part', 'share'],
-                weight: 1.0
-            },
-            performance_overview: {
-                keywords: ['overview', 'dashboard', 'summary', 'performance', 'status', 'snapshot', 'overall'],
-                semanticSignals: ['key', 'main', 'primary', 'important', 'critical', 'total', 'overall'],
-                weight: 1.2
-            },
-            correlation_analysis: {
-                keywords: ['correlation', 'relationship', 'related', 'connection', 'impact', 'effect', 'influence'],
-                semanticSignals: ['factor', 'driver', 'cause', 'affect', 'dependent', 'independent'],
-                weight: 0.8
-            },
-            anomaly_detection: {
-                keywords: ['anomaly', 'outlier', 'unusual', 'abnormal', 'spike', 'drop', 'unexpected'],
-                semanticSignals: ['strange', 'weird', 'odd', 'different', 'deviation', 'exception'],
-                weight: 0.7
-            },
-            forecasting: {
-                keywords: ['forecast', 'predict', 'future', 'projection', 'estimate', 'anticipate'],
-                semanticSignals: ['next', 'upcoming', 'expected', 'projected', 'planned'],
-                weight: 0.6
-            },
-            drill_down: {
-                keywords: ['detail', 'detailed', 'specific', 'granular', 'deep', 'drill'],
-                semanticSignals: ['exactly', 'precisely', 'specifically', 'particular', 'individual'],
-                weight: 0.9
-            }
-        };
-
         // Calculate intent scores with complex query handling
         const intentScores: { [key: string]: { score: number; matchedKeywords: string[]; matchedSignals: string[] } } = {};
 
-        for (const [intentType, pattern] of Object.entries(intentPatterns)) {
-            // Use both original and preprocessed prompt for matching
-            const matchedKeywords = pattern.keywords.filter(keyword =>
-                preprocessedPrompt.includes(keyword) || promptLower.includes(keyword)
-            );
+        for (const [intentType, pattern] of Object.entries(INTENT_PATTERNS)) {
+            // One pass over the keywords covers matching against both prompt
+            // variants and the exact-phrase boost, instead of re-scanning
+            const matchedKeywords: string[] = [];
+            let phraseBoost = 0;
+            for (const keyword of pattern.keywords) {
+                const inPreprocessed = preprocessedPrompt.includes(keyword);
+                if (inPreprocessed || promptLower.includes(keyword)) {
+                    matchedKeywords.push(keyword);
+                }
+                if (inPreprocessed) {
+                    phraseBoost += 0.3;
+                }
+            }
             const matchedSignals = pattern.semanticSignals.filter(signal =>
                 words.some(word => word.includes(signal) || signal.includes(word))
             );
@@ -116,11 +138,7 @@ export class IntentAnalyzerService {
             score *= pattern.weight;
 
             // Boost score for exact phrase matches
-            pattern.keywords.forEach(keyword => {
-                if (preprocessedPrompt.includes(keyword)) {
-                    score += 0.3;
-                }
-            });
+            score += phraseBoost;
 
             // Enhance temporal scoring based on temporal context
             if (intentType === 'temporal_trend' && temporalContext.timeframes.length > 0) {
@@ -468,14 +486,7 @@ export class IntentAnalyzerService {
      * Extract explicitly mentioned metrics from the prompt
      */
     private extractExplicitMetrics(prompt: string): string[] {
-        const metricPatterns = [
-            'sales', 'revenue', 'profit', 'margin', 'cost', 'expenses', 'income',
-            'customers', 'users', 'orders', 'transactions', 'conversion',
-            'growth', 'decline', 'performance', 'efficiency', 'productivity',
-            'cash', 'balance', 'debt', 'assets', 'liabilities'
-        ];
-
-        return metricPatterns.filter(metric => prompt.includes(metric));
+        return METRIC_PATTERNS.filter(metric => prompt.includes(metric));
     }
 
     /**
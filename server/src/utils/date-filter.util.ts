@@ -3,6 +3,44 @@
  * Consolidates duplicate date filtering logic from multiple services
  */
 export class DateFilterUtil {
+    // Compiled once at class definition; the validators below run per request
+    // and isFullDateFormat can run per filtered collection
+    private static readonly YEAR_RE = /^\d{4}$/;
+    private static readonly YEAR_MONTH_RE = /^\d{4}-\d{2}$/;
+    private static readonly FULL_DATE_RE = /^\d{4}-\d{2}-\d{2}$/;
+    private static readonly ISO_RANGE_RE = /^\d{4}-\d{2}-\d{2}T.*,\d{4}-\d{2}-\d{2}T.*$/;
+
+    /**
+     * Compile a date range into a per-date predicate
+     *
+     * Classifies the range once — ISO-range bounds are split and trimmed up
+     * front — so the returned closure does a single comparison per date
+     * instead of re-parsing the range for every row
+     * @param dateRange - Date range string (YYYY, YYYY-MM, YYYY-MM-DD, or ISO range)
+     * @returns Predicate over date strings, or null when the range accepts
+     * everything so callers can skip per-row filtering entirely
+     */
+    static compileDatePredicate(dateRange?: string): ((date: string) => boolean) | null {
+        if (!dateRange) {
+            return null;
+        }
+
+        // Custom ISO date ranges (e.g., "2025-05-06T00:00:00.000Z,2025-08-04T23:59:59.999Z")
+        if (dateRange.includes(',')) {
+            const [startISO, endISO] = dateRange.split(',');
+            const startDate = this.extractDatePart(startISO);
+            const endDate = this.extractDatePart(endISO);
+
+            return (date: string) => {
+                const itemDate = this.extractDatePart(date);
+                return itemDate >= startDate && itemDate <= endDate;
+            };
+        }
+
+        // YYYY, YYYY-MM and YYYY-MM-DD are all prefix matches
+        return (date: string) => date.startsWith(dateRange);
+    }
+
     /**
      * Filter array of items by date range
      * @param items - Array of items to filter
@@ -16,28 +54,10 @@ export class DateFilterUtil {
         dateRange?: string
     ): T[] {
         if (!dateRange || !items.length) return items;
-        
-        return items.filter(item => {
-            if (!item[dateField]) return false;
-            
-            // Handle custom ISO date ranges (e.g., "2025-05-06T00:00:00.000Z,2025-08-04T23:59:59.999Z")
-            if (dateRange.includes(',')) {
-                const [startISO, endISO] = dateRange.split(',');
-                const startDate = this.extractDatePart(startISO);
-                const endDate = this.extractDatePart(endISO);
-                const itemDate = this.extractDatePart(item[dateField]);
-                
-                return itemDate >= startDate && itemDate <= endDate;
-            }
-            
-            // Handle YYYY-MM-DD format
-            if (this.isFullDateFormat(dateRange)) {
-                return item[dateField].startsWith(dateRange);
-            }
-            
-            // Handle YYYY-MM and YYYY formats
-            return item[dateField] && item[dateField].startsWith(dateRange);
-        });
+
+        const inRange = this.compileDatePredicate(dateRange);
+        if (!inRange) return items;
+        return items.filter(item => item[dateField] && inRange(item[dateField]));
     }
 
     /**
@@ -48,35 +68,18 @@ export class DateFilterUtil {
      */
     static getDateIndicesInRange(dates: string[], dateRange?: string): number[] {
         if (!dateRange || !dates.length) return dates.map((_, i) => i);
-        
+
+        const inRange = this.compileDatePredicate(dateRange);
+        if (!inRange) return dates.map((_, i) => i);
+
         const filteredIndices: number[] = [];
-        
+
         dates.forEach((date, index) => {
-            if (!date) return;
-            
-            // Handle custom ISO date ranges
-            if (dateRange.includes(',')) {
-                const [startISO, endISO] = dateRange.split(',');
-                const startDate = this.extractDatePart(startISO);
-                const endDate = this.extractDatePart(endISO);
-                const itemDate = this.extractDatePart(date);
-                
-                if (itemDate >= startDate && itemDate <= endDate) {
-                    filteredIndices.push(index);
-                }
-            }
-            // Handle YYYY-MM-DD format
-            else if (this.isFullDateFormat(dateRange)) {
-                if (date.startsWith(dateRange)) {
-                    filteredIndices.push(index);
-                }
-            }
-            // Handle YYYY-MM and YYYY formats
-            else if (date.startsWith(dateRange)) {
+            if (date && inRange(date)) {
                 filteredIndices.push(index);
             }
         });
-        
+
         return filteredIndices;
     }
 
@@ -89,10 +92,10 @@ export class DateFilterUtil {
         if (!dateRange) return false;
         
         return (
-            /^\d{4}$/.test(dateRange) ||                                    // YYYY
-            /^\d{4}-\d{2}$/.test(dateRange) ||                             // YYYY-MM
-            /^\d{4}-\d{2}-\d{2}$/.test(dateRange) ||                       // YYYY-MM-DD
-            /^\d{4}-\d{2}-\d{2}T.*,\d{4}-\d{2}-\d{2}T.*$/.test(dateRange)  // Custom ISO range
+            this.YEAR_RE.test(dateRange) ||          // YYYY
+            this.YEAR_MONTH_RE.test(dateRange) ||    // YYYY-MM
+            this.FULL_DATE_RE.test(dateRange) ||     // YYYY-MM-DD
+            this.ISO_RANGE_RE.test(dateRange)        // Custom ISO range
         );
     }
 
@@ -111,6 +114,6 @@ export class DateFilterUtil {
      * @returns True if full date format
      */
     private static isFullDateFormat(dateRange: string): boolean {
-        return /^\d{4}-\d{2}-\d{2}$/.test(dateRange);
+        return this.FULL_DATE_RE.test(dateRange);
     }
 }
\ No newline at end of file